@@ -97,12 +97,13 @@ def main():
     log.info("Step 5: Generating Plots")
     log.info("=" * 60)
     
-    plot_all_scatter(results, output_dir=paths.plots_output, save=True)
-    plot_all_concentration_histograms(results, output_dir=paths.plots_output, save=True)
-    plot_comparison_bars(results, output_dir=paths.plots_output, save=True)
-    plot_recovery_histogram(results, output_dir=paths.plots_output, save=True)
-    plot_mean_recovery_time(results, output_dir=paths.plots_output, save=True)
-    plot_metric_histogram(results, bins=30, output_dir=paths.plots_output, save=True)
+    # Figures are only saved, so none are kept open for display
+    plot_all_scatter(results, output_dir=paths.plots_output, save=True, show=False)
+    plot_all_concentration_histograms(results, output_dir=paths.plots_output, save=True, show=False)
+    plot_comparison_bars(results, output_dir=paths.plots_output, save=True, show=False)
+    plot_recovery_histogram(results, output_dir=paths.plots_output, save=True, show=False)
+    plot_mean_recovery_time(results, output_dir=paths.plots_output, save=True, show=False)
+    plot_metric_histogram(results, bins=30, output_dir=paths.plots_output, save=True, show=False)
     
     log.info("")
     log.info("=" * 60)
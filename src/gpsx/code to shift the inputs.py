@@ -1,22 +1,26 @@
 import random
 import os
+import logging
 import pandas as pd
-import pickle
 import numpy as np
 #from queue import Queue
 from datetime import datetime as dt
 from datetime import timedelta as time_delta
-import scipy.stats as stats
 
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 #global bod, cod, c_bod, c_cod, bodi, codi
-global output_df, base_concentrations, start_dt, dfi
+global output_rows, output_index, base_concentrations, start_dt, dfi
 global base_report_path,  set_random_inputs ,monte_carlo_sim
 
 # simulation information
 number_of_monte_carlo = 7
 CommInt = 0.08
 StopTime = 60.0
+rng = np.random.default_rng()  # generator for the shifted input samples
+chosen_shift = 1.9 # shift the mean of the %
+input_params = {}  # column -> (shifted_mean_log, std_log), fitted once in start()
 #Bodlt = 25
 #Bodut = 50 
 #Bodp = 0.7
@@ -35,7 +39,6 @@ def profile_variables():
     """
     Returns a dictionary containing the variables that profiles will be obtained for
     """
-    print("profile variables start")
     profile_variables = {
         'snh1': 'Ammonia influent',
         'snh31':'Ammonia effluent',
@@ -50,7 +53,6 @@ def profile_variables():
         'asnh132': 'Ammonia influent composite',
         'asnh124':'Ammonia effluent composite',
     }    
-    print("profile variables end")
     return profile_variables
 
 #def single_observation_variables():
@@ -68,19 +70,25 @@ def profile_variables():
 #    print("single_variables")
 #    return single_variables   
 
-        
-def build_profile_df():
+
+# column order of the profile dataframe, built once rather than every interval
+PROFILE_COLS = tuple(profile_variables().keys())
+
+
+def build_profile_df(rows=None, index=None):
     """
-    Builds an empty dataframe where results of the GPS-X simulation are stored
+    Builds the dataframe where results of the GPS-X simulation are stored
+
+    rows (list): Collected output rows, one value per profile variable
+    index (list): Index value for each row
     """
-    print("build_profile start")
-    df = pd.DataFrame()
-    variables = profile_variables()
-    
-    for var in variables:
-        df[var] = None
+    # one float block for all rows, rather than inferring dtypes row by row
+    values = np.array(rows if rows else [], dtype=float).reshape(-1, len(PROFILE_COLS))
+    df = pd.DataFrame(values, index=index, columns=PROFILE_COLS)
+
+    # a repeated index value overwrites the earlier row
+    df = df[~df.index.duplicated(keep='last')]
 
-    print("build_profile end")
     return df
 
 #def build_single_observation_df():
@@ -94,48 +102,35 @@ def build_profile_df():
 #    return df
 
 
-def collect_outputs(df, index_type):
+def collect_outputs(rows, index, index_type):
     """
     Gets the value of simulation outputs to be observed in the GPS-X simulation
 
-    df (dataframe): Dataframe where observed values will be stored
+    rows (list): List the observed values are appended to, one row per call
+    index (list): List the row index values are appended to
     index_type (str): datetime -> use a datetime index
                       monte_carlo -> use current monte carlo iteration as an index
-    data_frame (dataframe): Dataframe containing the simulation variables
     """
-    print("collect output start")
-    results = []
-
-    for variable in df.columns:
-        
-        simulation_value = get_simulation_value(variable)
-        results.append(simulation_value)
+    results = tuple(get_simulation_value(variable) for variable in PROFILE_COLS)
 
     if index_type == 'datetime':
-        df.loc[get_sim_dt(), :] = results
+        index.append(get_sim_dt())
     elif index_type == 'monte_carlo':
-        df.loc[monte_carlo_sim, :] = results
+        index.append(monte_carlo_sim)
     else:  # if not one of the specified index types, have an incrementing index
-        df.loc[len(df.index), :] = results
-    print("collect output end")
+        index.append(len(index))
+    rows.append(results)
 
 def get_simulation_value(variable):
     """
     Gets the current value of a parameter in the GPS-X simulation
     """
-    print("get simulation value start")
     if '(' in variable:
         cryptic, index = variable.split('(')
-        print(f"variable: {variable}, index: {index}, cryptic: {cryptic}")
-        print(f"value before index shift: {gpsx.getValue(cryptic)}")
         index = int(index[:-1])
         value = gpsx.getValueAtIndex(cryptic, index)
-        print(f"value after index shift: {value}")
     else:
-        
         value = gpsx.getValue(variable)
-        print(f"variable non split: [{variable}= {value}]")
-    print("get simulation value end")
     return value
 
 
@@ -143,7 +138,7 @@ def set_default_sim_parameters():
     """
     Sets the default GPS-X simulation parameters
     """
-    print("set_default_sim_parameters start")
+    logger.debug("set_default_sim_parameters start")
     gpsx.resetSim()
     gpsx.resetAllValues()
     gpsx.setCint(CommInt)
@@ -151,39 +146,38 @@ def set_default_sim_parameters():
     gpsx.setSteady(True)
     #gpsx.setValue('truckNumber', 0)
     #gpsx.setValue('rainEvents', 0)
-    print("set_default_sim_parameters end")
+    logger.debug("set_default_sim_parameters end")
 
 def set_start_dt(start_dt):
     """
     Sets the simulation start time values in GPS-X
     """
-    print("set_start_dt start")
-    gpsx.setValueAtIndex('ztime', 1, start_dt.year)
-    gpsx.setValueAtIndex('ztime', 2, start_dt.month)
-    gpsx.setValueAtIndex('ztime', 3, start_dt.day)
-    gpsx.setValueAtIndex('ztime', 4, start_dt.hour)
-    gpsx.setValueAtIndex('ztime', 5, start_dt.minute)
-    gpsx.setValueAtIndex('ztime', 6, start_dt.second)
-    print("set_start_dt end")
+    logger.debug("set_start_dt start")
+    set_value_at_index = gpsx.setValueAtIndex
+    fields = (start_dt.year, start_dt.month, start_dt.day,
+              start_dt.hour, start_dt.minute, start_dt.second)
+    for index, value in enumerate(fields, start=1):
+        set_value_at_index('ztime', index, value)
+    logger.debug("set_start_dt end")
 
 def get_sim_dt():
     """
     Returns the current datetime for the simulation
     """
-    print("get_sim_dt start")
-    if gpsx.getValue('t') != 0:
-        year = int(gpsx.getValue('iyear'))
-        month = int(gpsx.getValue('imonth'))
-        day = int(gpsx.getValue('iday'))
-        hour = int(gpsx.getValue('ihour'))
-        minute = int(gpsx.getValue('iminute'))
-        second = int(gpsx.getValue('isec'))
+    # read the calendar fields back from GPS-X so timestamps match the
+    # simulator exactly; bind getValue once as this runs every interval
+    get_value = gpsx.getValue
+    if get_value('t') != 0:
+        year = int(get_value('iyear'))
+        month = int(get_value('imonth'))
+        day = int(get_value('iday'))
+        hour = int(get_value('ihour'))
+        minute = int(get_value('iminute'))
+        second = int(get_value('isec'))
 
         current_time = dt(year, month, day, hour, minute, second)
     else:
         current_time = start_dt
-    
-    print("get_sim_dt end")
 
     return current_time
 
@@ -193,9 +187,7 @@ def get_elapsed_time():
     """
     Returns the elapsed simulation time in seconds
     """
-    print("get_elapsed_time start")
     elapsed_seconds = gpsx.getValue('t')
-    print("get_elapsed_time end")
 
     return elapsed_seconds
 
@@ -205,52 +197,57 @@ def start():
         
         file_path = "C:/Users/Anna Stefania Laino/OneDrive - Newcastle University/NEW WORK- OMAR/CSTR/hybrid aeration n1 - mech aeration/composite sample/cstr - gpsx/Inlet - N-D 2021.xls"
 
-        dfi = pd.read_excel(file_path, header=0)
+        cache_path = os.path.splitext(file_path)[0] + '.pkl'
 
-        dfi = dfi.drop(dfi.columns[0], axis=1)
-        
-        print(f"dfi_col_dropped: {dfi}")
-        print("read excel end")
+        # parsing the xls is slow, so reuse a pickled copy while it is up to date
+        if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(file_path):
+            dfi = pd.read_pickle(cache_path)
+        else:
+            dfi = pd.read_excel(file_path, header=0)
 
-        print("start")
+            dfi = dfi.drop(dfi.columns[0], axis=1)
+            # the cache is only a speed-up, so a failed write must not stop the run
+            try:
+                dfi.to_pickle(cache_path)
+            except OSError as e:
+                logger.warning("could not write input cache %s: %s", cache_path, e)
+        
+        logger.debug("dfi_col_dropped: %s", dfi)
+        fit_input_distributions()
+        logger.info("start")
 
     except Exception as e:
-        print(e)
+        logger.error(e)
 
-def set_random_inputs():
-    print("set_random_inputs start")
-    columns_to_fit = dfi.columns[:]
+def fit_input_distributions():
+    """
+    Fits the shifted lognormal parameters of each inlet column
 
-    chosen_shift = 1.9 # shift the mean of the %
+    The parameters only depend on dfi and chosen_shift, so they are computed
+    once here rather than on every communication interval
+    """
+    input_params.clear()
     alp = np.log(1 + chosen_shift)
-    shifted_data_df = pd.DataFrame()
-    for column in columns_to_fit:
+    for column in dfi.columns:
         data = dfi[column].values
 
         data_numeric = pd.to_numeric(data, errors='coerce')
         data_numeric = data_numeric[~np.isnan(data_numeric)]
 
         if len(data_numeric) == 0:
-            print(f"Column '{column}' contains no valid numeric data. Skipping.")
+            logger.warning("Column '%s' contains no valid numeric data. Skipping.", column)
             continue
 
         log_data = np.log(data_numeric)
         mean_log = np.mean(log_data)
         std_log = np.std(log_data)
 
-        original_dist = stats.lognorm(s=std_log, scale=np.exp(mean_log))
-        shifted_mean_log = mean_log + alp
-        shifted_dist = stats.lognorm(s=std_log, scale=np.exp(shifted_mean_log))
-
-        num_samples = len(data_numeric)
-        shifted_samples = shifted_dist.rvs(size=num_samples)
-        shifted_data_df[column] = shifted_samples
-
-        for index, value in enumerate(shifted_samples):
-            value_to_set = value
-            gpsx.setValue(column, value_to_set) 
+        input_params[column] = (mean_log + alp, std_log)
 
-    print("set_random_inputs end")
+def set_random_inputs():
+    for column, (shifted_mean_log, std_log) in input_params.items():
+        # setValue has no index, so a single draw per column is all that takes effect
+        gpsx.setValue(column, rng.lognormal(mean=shifted_mean_log, sigma=std_log))
 
 
 
@@ -258,12 +255,11 @@ def set_random_inputs():
 def cint():
     try:
         set_random_inputs()
-        df = build_profile_df()  # Define and initialize df
-        collect_outputs(output_df, 'datetime')
+        collect_outputs(output_rows, output_index, 'datetime')
             
 
     except Exception as e:
-        print(f"An error occurred: {e}")
+        logger.error("An error occurred: %s", e)
 
 
 # eor() function executed once at the end of simulation
@@ -272,24 +268,36 @@ def cint():
 def eor():
     global finished
 
-    print(f"output_df: {output_df}")
-    with open(os.path.join(report_path, 'profile_run_{}.pkl'.format(monte_carlo_sim)), 'wb') as f:
-        f.write(pickle.dumps(output_df))
+    output_df = build_profile_df(output_rows, output_index)
+    logger.debug("output_df: %s", output_df)
+    # stream straight to disk rather than building the pickled bytes in memory first
+    output_df.to_pickle(os.path.join(report_path, 'profile_run_{}.pkl'.format(monte_carlo_sim)))
     
     finished = True
 
     try:
         pass
     except Exception as e:
-        print(e)
+        logger.error(e)
         base_path = os.getcwd()
 
 
 report_path = os.path.join(os.getcwd(), 'base_results')  # path where pickled files will be stored
 
-for monte_carlo_sim in range(1, number_of_monte_carlo + 1):
-    print("Sim: ", monte_carlo_sim)
-    output_df = build_profile_df()  # Start a fresh collection of profiles
+def run_monte_carlo(sim):
+    """
+    Runs a single Monte Carlo iteration; eor() pickles its profiles
+
+    GPS-X drives cint() and eor() as callbacks on one embedded simulator, so
+    the per-run state they read is kept in module globals and iterations
+    cannot be dispatched to worker processes
+    """
+    global monte_carlo_sim, output_rows, output_index, rain_events, start_dt
+
+    monte_carlo_sim = sim
+    logger.info("Sim: %s", monte_carlo_sim)
+    output_rows = []  # Start a fresh collection of profiles
+    output_index = []
     #sludge_trucks = Queue() # Create a new sludge truck queue
     rain_events = {}  # Create a new rain event tracking dictionary
     
@@ -299,4 +307,5 @@ for monte_carlo_sim in range(1, number_of_monte_carlo + 1):
     runSim()
 
 
-
+for sim in range(1, number_of_monte_carlo + 1):
+    run_monte_carlo(sim)
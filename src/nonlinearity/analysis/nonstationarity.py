@@ -10,6 +10,37 @@ import pandas as pd
 import numpy as np
 
 
+def _score_columns(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Non-stationarity scores for each column of a NaN-free 2-D array.
+    
+    Args:
+        values: Array of shape (n_samples, n_columns), n_samples >= window.
+        window: Rolling window size for variance calculation.
+    
+    Returns:
+        Array of scores, one per column.
+    """
+    overall_var = values.var(axis=0, ddof=1)
+    
+    # Rolling variance from cumulative sums (centred to limit cancellation)
+    centred = values - values.mean(axis=0)
+    zeros = np.zeros((1, values.shape[1]))
+    c1 = np.concatenate((zeros, np.cumsum(centred, axis=0)))
+    c2 = np.concatenate((zeros, np.cumsum(centred * centred, axis=0)))
+    s1 = c1[window:] - c1[:-window]
+    s2 = c2[window:] - c2[:-window]
+    
+    # window=1 divides by zero and gives NaN scores, as rolling().var() did
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rolling_var = np.maximum((s2 - s1 * s1 / window) / (window - 1), 0.0)
+        
+        # Calculate normalised score (constant columns score zero)
+        scores = np.abs(rolling_var - overall_var).mean(axis=0) / overall_var
+    
+    return np.where(overall_var == 0, 0.0, scores)
+
+
 def non_stationarity_score(
     series: pd.Series,
     window: int = 30
@@ -38,21 +69,15 @@ def non_stationarity_score(
     if len(clean_series) < window:
         return np.nan
     
-    rolling_var = clean_series.rolling(window=window).var()
-    overall_var = clean_series.var()
-    
-    if overall_var == 0:
-        return 0.0
+    values = clean_series.to_numpy(dtype=np.float64, copy=False)
     
-    # Calculate normalised score
-    score = (rolling_var - overall_var).abs().mean() / overall_var
-    
-    return float(score)
+    return float(_score_columns(values[:, np.newaxis], window)[0])
 
 
 def compute_nonstationarity_table(
     results: dict,
-    columns: List[str] = None
+    columns: List[str] = None,
+    window: int = 30
 ) -> pd.DataFrame:
     """
     Compute non-stationarity scores for all scenarios.
@@ -60,6 +85,7 @@ def compute_nonstationarity_table(
     Args:
         results: Dictionary mapping scenario names to DataFrames.
         columns: List of columns to analyse. Defaults to linearised columns.
+        window: Rolling window size for variance calculation.
     
     Returns:
         DataFrame with non-stationarity scores.
@@ -73,13 +99,19 @@ def compute_nonstationarity_table(
         if df.empty:
             continue
         
-        row = {"Dataset": scenario_name}
+        present = [col for col in columns if col in df.columns]
+        values = df[present].to_numpy(dtype=np.float64)
         
-        for col in columns:
-            if col in df.columns:
-                row[col] = non_stationarity_score(df[col])
+        if len(values) < window:
+            scores = [np.nan] * len(present)
+        elif np.isnan(values).any():
+            # Columns drop their own NaNs, so score them one at a time
+            scores = [non_stationarity_score(df[col], window) for col in present]
+        else:
+            # Score every column in one pass over the 2-D block
+            scores = _score_columns(values, window).tolist()
         
-        rows.append(row)
+        rows.append({"Dataset": scenario_name, **dict(zip(present, scores))})
     
     return pd.DataFrame(rows)
 
@@ -12,6 +12,37 @@ import numpy as np
 from ..config import SimulationConfig
 
 
+def _failure_mask(series: pd.Series, failure_types: tuple) -> np.ndarray:
+    """
+    Boolean mask of rows whose value is one of the failure types.
+    
+    Boolean series are taken as the mask itself. Categorical series are
+    matched on their integer codes rather than by comparing strings.
+    """
+    if pd.api.types.is_bool_dtype(series.dtype):
+        return series.to_numpy(dtype=bool)
+    
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.categories.get_indexer(list(failure_types))
+        return np.isin(series.cat.codes.to_numpy(), codes[codes >= 0])
+    
+    return series.isin(frozenset(failure_types)).to_numpy(dtype=bool)
+
+
+def _run_lengths(mask: np.ndarray) -> np.ndarray:
+    """
+    Lengths of the consecutive True runs in a boolean array.
+    
+    A run still open at the end of the array is counted.
+    """
+    # +1 marks a run start, -1 marks the first False step after it
+    edges = np.diff(np.concatenate(([False], mask, [False])).astype(np.int8))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    
+    return ends - starts
+
+
 def compute_recovery_time(
     series: pd.Series,
     time_step: float = None,
@@ -24,7 +55,8 @@ def compute_recovery_time(
     period back to compliance.
     
     Args:
-        series: Series containing failure type values.
+        series: Series containing failure type values, or a boolean
+                non-compliance mask such as the 'is_failure' column.
         time_step: Time step in simulation units (default: 0.08 days).
         failure_types: Tuple of values considered as failures/non-compliance.
     
@@ -34,28 +66,9 @@ def compute_recovery_time(
     if time_step is None:
         time_step = SimulationConfig.TIME_STEP
     
-    recovery_times = []
-    non_compliance_duration = 0
-    in_non_compliance = False
-    
-    for failure_type in series:
-        if failure_type in failure_types:
-            if not in_non_compliance:
-                in_non_compliance = True
-            non_compliance_duration += 1
-        else:
-            if in_non_compliance:
-                recovery_time = round(non_compliance_duration * time_step, 2)
-                recovery_times.append(recovery_time)
-                non_compliance_duration = 0
-                in_non_compliance = False
+    durations = _run_lengths(_failure_mask(series, failure_types))
     
-    # Check for ongoing non-compliance at the end of the series
-    if in_non_compliance:
-        recovery_time = round(non_compliance_duration * time_step, 2)
-        recovery_times.append(recovery_time)
-    
-    return recovery_times
+    return np.round(durations * time_step, 2).tolist()
 
 
 def compute_recovery_time_minutes(
@@ -131,8 +144,11 @@ def get_recovery_analysis(
         if df.empty or "fail_type" not in df.columns:
             continue
         
+        # Prefer the precomputed failure mask over rescanning fail_type
+        failures = df["is_failure"] if "is_failure" in df.columns else df["fail_type"]
+        
         recovery_times_minutes = compute_recovery_time_minutes(
-            df["fail_type"], 
+            failures, 
             time_step,
         )
         
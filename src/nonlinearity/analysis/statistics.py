@@ -4,6 +4,7 @@ Statistical analysis functions.
 Extracts statistical calculations from the original notebook.
 """
 
+import warnings
 from typing import Dict, List, Optional
 
 import pandas as pd
@@ -30,14 +31,22 @@ def compute_summary_stats(
     # Filter to existing columns
     columns = [col for col in columns if col in df.columns]
     
-    stats = {
-        'mean': df[columns].mean(),
-        'std': df[columns].std(),
-        'min': df[columns].min(),
-        'max': df[columns].max(),
-    }
-    
-    return pd.DataFrame(stats, index=columns).T
+    values = df[columns].to_numpy(dtype=np.float64)
+    stats = np.full((4, len(columns)), np.nan)
+    
+    # NaN-skipping reductions over the 2-D block, matching pandas defaults
+    if len(values):
+        with warnings.catch_warnings():
+            # All-NaN columns yield NaN, as in pandas
+            warnings.simplefilter("ignore", RuntimeWarning)
+            np.nanmean(values, axis=0, out=stats[0])
+            np.nanstd(values, axis=0, ddof=1, out=stats[1])
+            np.nanmin(values, axis=0, out=stats[2])
+            np.nanmax(values, axis=0, out=stats[3])
+    
+    return pd.DataFrame(
+        stats, index=['mean', 'std', 'min', 'max'], columns=columns
+    )
 
 
 def compute_cv(
@@ -59,7 +68,9 @@ def compute_cv(
     
     columns = [col for col in columns if col in df.columns]
     
-    return df[columns].std() / df[columns].mean()
+    stats = df[columns].agg(['mean', 'std'])
+    
+    return stats.loc['std'] / stats.loc['mean']
 
 
 def compute_all_statistics(
@@ -109,17 +120,30 @@ def get_compliance_summary(
         if df.empty or "fail_type" not in df.columns:
             continue
         
+        if {"is_compliant", "is_lut", "is_max_limit"}.issubset(df.columns):
+            # Reduce the precomputed boolean columns
+            compliant = df["is_compliant"].sum()
+            lut = df["is_lut"].sum()
+            max_limit = df["is_max_limit"].sum()
+        else:
+            # One counting pass instead of an equality scan per category
+            type_counts = df["fail_type"].value_counts()
+            compliant = type_counts.get("Compliant", 0)
+            lut = type_counts.get("LUT exceedance", 0)
+            max_limit = type_counts.get("Max Limit Failure", 0)
+        
         row = {
             "Scenario": scenario_name,
             "Total Records": len(df),
-            "Compliant": (df["fail_type"] == "Compliant").sum(),
-            "LUT Exceedance": (df["fail_type"] == "LUT exceedance").sum(),
-            "Max Limit Failure": (df["fail_type"] == "Max Limit Failure").sum(),
+            "Compliant": compliant,
+            "LUT Exceedance": lut,
+            "Max Limit Failure": max_limit,
         }
         
         if "fail_source" in df.columns:
-            row["BOD Source"] = (df["fail_source"] == "BOD").sum()
-            row["COD Source"] = (df["fail_source"] == "COD").sum()
+            source_counts = df["fail_source"].value_counts()
+            row["BOD Source"] = source_counts.get("BOD", 0)
+            row["COD Source"] = source_counts.get("COD", 0)
         
         summary_data.append(row)
     
@@ -174,13 +198,16 @@ def compute_exceedance_analysis(
         if df.empty:
             continue
         
-        scenario_probs = {}
-        for column, threshold in thresholds.items():
-            if column in df.columns:
-                scenario_probs[f"prob_{column}_gt_{threshold}"] = (
-                    compute_probability_exceedance(df, column, threshold)
-                )
+        # Compare all present columns against their thresholds in one pass
+        present = pd.Series(
+            {col: thr for col, thr in thresholds.items() if col in df.columns},
+            dtype=float
+        )
+        probs = df[present.index].gt(present).mean()
         
-        analysis[scenario_name] = scenario_probs
+        analysis[scenario_name] = {
+            f"prob_{column}_gt_{thresholds[column]}": probs[column]
+            for column in present.index
+        }
     
     return analysis
@@ -5,16 +5,18 @@ Contains all project constants, compliance limits, and path configurations.
 """
 
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Dict
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ComplianceLimits:
     """
     Compliance limits for BOD and COD analysis.
     
-    All values are in mg/L unless otherwise specified.
+    All values are in mg/L unless otherwise specified. Instances are
+    immutable and hashable, so they can be used as cache keys.
     """
     bod_upper: float = 50
     bod_lower: float = 25
@@ -47,31 +49,33 @@ class SimulationConfig:
     MINUTES_PER_HOUR: int = 60
 
 
-@dataclass
+@dataclass(frozen=True)
 class ProjectPaths:
     """
     Project path configuration.
     
-    Uses pathlib for cross-platform path handling.
+    Uses pathlib for cross-platform path handling. Instances are frozen
+    so derived paths can be cached and shared between callers (not
+    slotted, as cached_property stores its values in __dict__).
     """
     root: Path
     
-    @property
+    @cached_property
     def data(self) -> Path:
         """Path to data directory."""
         return self.root / "data"
     
-    @property
+    @cached_property
     def output(self) -> Path:
         """Path to output directory."""
         return self.root / "output"
     
-    @property
+    @cached_property
     def csv_output(self) -> Path:
         """Path to CSV output directory."""
         return self.output / "csv"
     
-    @property
+    @cached_property
     def plots_output(self) -> Path:
         """Path to plots output directory."""
         return self.output / "plots"
@@ -102,11 +106,26 @@ REQUIRED_COLUMNS = [
     'bod1', 'cod1', 'bod31', 'cod31', 'snh1', 'snh31'
 ]
 
+# Categories of the processed fail_type and fail_source columns
+# (stored as pandas categoricals; the position is the integer code)
+FAIL_TYPES = ("Compliant", "LUT exceedance", "Max Limit Failure")
+FAIL_SOURCES = ("None", "BOD", "COD")
+
+# Concentration columns, stored as float32 once loaded (measured to
+# ~1 mg/L, so single precision is ample). Every derived column of the
+# compliance pipeline is then float32 as well; values are min-max
+# normalised, so results agree with float64 to ~1e-6.
+CONCENTRATION_COLUMNS = ['bod1', 'bod31', 'cod1', 'cod31', 'snh1', 'snh31']
 
+
+@lru_cache(maxsize=8)
 def get_config(root_path: Path = None) -> tuple[ComplianceLimits, ProjectPaths]:
     """
     Get configuration based on the project root path.
     
+    Results are memoised per root_path; both returned objects are frozen,
+    so the cached tuple is safe to share.
+    
     Args:
         root_path: Path to project root. Defaults to src/nonlinearity parent.
     
@@ -4,15 +4,20 @@ Compliance calculation functions.
 Extracts BOD and COD limit calculations from the original notebook.
 """
 
+from typing import Dict, Optional
+
 import pandas as pd
 import numpy as np
 
 from ..config import ComplianceLimits
+from .linearisation import compute_normalisation_stats
 
 
 def calculate_bod_limits(
     df: pd.DataFrame,
-    limits: ComplianceLimits
+    limits: ComplianceLimits,
+    stats: Optional[Dict[str, float]] = None,
+    copy: bool = True
 ) -> pd.DataFrame:
     """
     Calculate BOD compliance limits.
@@ -20,28 +25,36 @@ def calculate_bod_limits(
     Args:
         df: DataFrame with 'bod1' (influent) and 'bod31' (effluent) columns.
         limits: Compliance limits configuration.
+        stats: Precomputed normalisation bounds from
+               compute_normalisation_stats. Computed from df if None.
+        copy: Whether to work on a copy. If False, columns are added
+              to df in place.
     
     Returns:
         DataFrame with added BOD limit columns.
     """
-    result = df.copy()
+    result = df.copy() if copy else df
+    
+    if stats is None:
+        stats = compute_normalisation_stats(df)
+    bod31_min = stats["bod31_min"]
+    bod_range = stats["bod1_max"] - bod31_min
+    
+    # Broadcast scalars keep the input precision (float32 after loading)
+    to_dtype = np.result_type(df["bod31"].dtype, np.float32).type
     
     # BOD limit calculations (upper and lower thresholds)
-    result['BODut'] = abs(
-        (limits.bod_upper - df["bod31"].min()) / 
-        (df["bod1"].max() - df["bod31"].min())
-    )
-    result['BODlt'] = abs(
-        (limits.bod_lower - df["bod31"].min()) / 
-        (df["bod1"].max() - df["bod31"].min())
-    )
+    result['BODut'] = to_dtype(abs((limits.bod_upper - bod31_min) / bod_range))
+    result['BODlt'] = to_dtype(abs((limits.bod_lower - bod31_min) / bod_range))
     
     return result
 
 
 def calculate_cod_limits(
     df: pd.DataFrame,
-    limits: ComplianceLimits
+    limits: ComplianceLimits,
+    stats: Optional[Dict[str, float]] = None,
+    copy: bool = True
 ) -> pd.DataFrame:
     """
     Calculate COD compliance limits.
@@ -49,28 +62,36 @@ def calculate_cod_limits(
     Args:
         df: DataFrame with 'cod1' (influent) and 'cod31' (effluent) columns.
         limits: Compliance limits configuration.
+        stats: Precomputed normalisation bounds from
+               compute_normalisation_stats. Computed from df if None.
+        copy: Whether to work on a copy. If False, columns are added
+              to df in place.
     
     Returns:
         DataFrame with added COD limit columns.
     """
-    result = df.copy()
+    result = df.copy() if copy else df
+    
+    if stats is None:
+        stats = compute_normalisation_stats(df)
+    cod31_min = stats["cod31_min"]
+    cod_range = stats["cod1_max"] - cod31_min
+    
+    # Broadcast scalars keep the input precision (float32 after loading)
+    to_dtype = np.result_type(df["cod31"].dtype, np.float32).type
     
     # COD limit calculations (upper and lower thresholds)
-    result['CODut'] = abs(
-        (limits.cod_upper - df["cod31"].min()) / 
-        (df["cod1"].max() - df["cod31"].min())
-    )
-    result['CODlt'] = abs(
-        (limits.cod_lower - df["cod31"].min()) / 
-        (df["cod1"].max() - df["cod31"].min())
-    )
+    result['CODut'] = to_dtype(abs((limits.cod_upper - cod31_min) / cod_range))
+    result['CODlt'] = to_dtype(abs((limits.cod_lower - cod31_min) / cod_range))
     
     return result
 
 
 def calculate_all_limits(
     df: pd.DataFrame,
-    limits: ComplianceLimits = None
+    limits: ComplianceLimits = None,
+    stats: Optional[Dict[str, float]] = None,
+    copy: bool = True
 ) -> pd.DataFrame:
     """
     Calculate both BOD and COD compliance limits.
@@ -78,6 +99,10 @@ def calculate_all_limits(
     Args:
         df: DataFrame with required columns.
         limits: Compliance limits. If None, uses defaults.
+        stats: Precomputed normalisation bounds from
+               compute_normalisation_stats. Computed from df if None.
+        copy: Whether to work on a copy. If False, columns are added
+              to df in place.
     
     Returns:
         DataFrame with all limit columns added.
@@ -85,35 +110,77 @@ def calculate_all_limits(
     if limits is None:
         limits = ComplianceLimits()
     
-    result = calculate_bod_limits(df, limits)
-    result = calculate_cod_limits(result, limits)
+    if stats is None:
+        stats = compute_normalisation_stats(df)
+    
+    result = calculate_bod_limits(df, limits, stats, copy=copy)
+    result = calculate_cod_limits(result, limits, stats, copy=False)
     
     return result
 
 
-def calculate_flag_conditions(df: pd.DataFrame) -> pd.DataFrame:
+def calculate_flag_conditions(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
     """
     Calculate boolean flag conditions for compliance.
     
     Args:
         df: DataFrame with BODut, BODlt, CODut, CODlt columns.
+        copy: Whether to work on a copy. If False, columns are added
+              to df in place.
     
     Returns:
         DataFrame with added flag columns.
     """
-    result = df.copy()
+    result = df.copy() if copy else df
+    
+    # Flag conditions based on limit thresholds, keyed to their source column
+    flag_sources = {
+        "flag_BODlt": 'BODlt-BODeffl',
+        "flag_BODut": 'BODut-BODeffl',
+        "flag_CODlt": 'CODlt-CODeffl',
+        "flag_reduction_bod": "bodp",
+        "flag_reduction_cod": "codp",
+        "flag_CODut": 'CODut-CODeffl',
+    }
     
-    # Flag conditions based on limit thresholds
-    result["flag_BODlt"] = result['BODlt-BODeffl'] >= 0
-    result["flag_BODut"] = result['BODut-BODeffl'] >= 0
-    result["flag_CODlt"] = result['CODlt-CODeffl'] >= 0
-    result["flag_reduction_bod"] = result["bodp"] >= 0
-    result["flag_reduction_cod"] = result["codp"] >= 0
-    result["flag_CODut"] = result['CODut-CODeffl'] >= 0
+    # Compare the raw buffers and insert all flags in one assignment
+    result[list(flag_sources)] = np.column_stack([
+        result[col].to_numpy() >= 0 for col in flag_sources.values()
+    ])
     
     return result
 
 
+def failure_masks(df: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """
+    Build the failure condition masks as numpy bool arrays.
+    
+    The flag columns are read as bool arrays before negating with ~, so
+    object-dtype flags from older pickles are handled as well.
+    
+    Args:
+        df: DataFrame with psi and flag columns.
+    
+    Returns:
+        Dictionary with a boolean array for each failure condition.
+    """
+    masks = {}
+    
+    for param in ("bod", "cod"):
+        upper = param.upper()
+        flag_lt = df[f"flag_{upper}lt"].to_numpy(dtype=bool)
+        flag_ut = df[f"flag_{upper}ut"].to_numpy(dtype=bool)
+        flag_reduction = df[f"flag_reduction_{param}"].to_numpy(dtype=bool)
+        
+        # Neither the lower threshold nor the reduction requirement is met
+        base = ~flag_lt & ~flag_reduction
+        
+        masks[f"{param}_lut_exc"] = (df[f"{param}_psi_2"].to_numpy() < 0) & base & flag_ut
+        masks[f"{param}_max_lim"] = (df[f"{param}_psi_3"].to_numpy() < 0) & base & ~flag_ut
+    
+    return masks
+
+
 def calculate_failure_conditions(
     df: pd.DataFrame
 ) -> dict:
@@ -126,37 +193,7 @@ def calculate_failure_conditions(
     Returns:
         Dictionary with boolean Series for each failure condition.
     """
-    # BOD FAILURE conditions
-    bod_lut_exc = (
-        (df['bod_psi_2'] < 0) & 
-        (df["flag_BODlt"] == False) & 
-        (df["flag_reduction_bod"] == False) & 
-        (df["flag_BODut"] == True)
-    )
-    bod_max_lim = (
-        (df['bod_psi_3'] < 0) & 
-        (df["flag_BODlt"] == False) & 
-        (df["flag_BODut"] == False) & 
-        (df["flag_reduction_bod"] == False)
-    )
-    
-    # COD FAILURE conditions
-    cod_lut_exc = (
-        (df['cod_psi_2'] < 0) & 
-        (df["flag_CODlt"] == False) & 
-        (df["flag_reduction_cod"] == False) & 
-        (df["flag_CODut"] == True)
-    )
-    cod_max_lim = (
-        (df['cod_psi_3'] < 0) & 
-        (df["flag_CODlt"] == False) & 
-        (df["flag_CODut"] == False) & 
-        (df["flag_reduction_cod"] == False)
-    )
-    
     return {
-        "bod_lut_exc": bod_lut_exc,
-        "bod_max_lim": bod_max_lim,
-        "cod_lut_exc": cod_lut_exc,
-        "cod_max_lim": cod_max_lim,
+        name: pd.Series(mask, index=df.index, name=name)
+        for name, mask in failure_masks(df).items()
     }
@@ -4,11 +4,44 @@ linearisation functions.
 Extracts linearisation calculations from the original notebook.
 """
 
+from typing import Dict, Optional
+
 import pandas as pd
 import numpy as np
 
 
-def linearise_bod(df: pd.DataFrame) -> pd.DataFrame:
+def compute_normalisation_stats(df: pd.DataFrame) -> Dict[str, float]:
+    """
+    Compute the min-max normalisation bounds used for limits and linearisation.
+    
+    Each bound is a full-column reduction, so computing them once and
+    passing them to every step avoids rescanning the same columns.
+    
+    Args:
+        df: DataFrame with influent ('bod1', 'cod1') and effluent
+            ('bod31', 'cod31') columns. Parameters whose columns are
+            missing are skipped.
+    
+    Returns:
+        Dictionary with 'bod1_max', 'bod1_min', 'bod31_min' and the
+        matching 'cod' bounds.
+    """
+    stats = {}
+    
+    for param in ("bod", "cod"):
+        if f"{param}1" in df.columns and f"{param}31" in df.columns:
+            stats[f"{param}1_max"] = df[f"{param}1"].max()
+            stats[f"{param}1_min"] = df[f"{param}1"].min()
+            stats[f"{param}31_min"] = df[f"{param}31"].min()
+    
+    return stats
+
+
+def linearise_bod(
+    df: pd.DataFrame,
+    stats: Optional[Dict[str, float]] = None,
+    copy: bool = True
+) -> pd.DataFrame:
     """
     Apply linearisation to BOD influent and effluent data.
     
@@ -17,26 +50,36 @@ def linearise_bod(df: pd.DataFrame) -> pd.DataFrame:
     
     Args:
         df: DataFrame with 'bod1' (influent) and 'bod31' (effluent) columns.
+        stats: Precomputed normalisation bounds from
+               compute_normalisation_stats. Computed from df if None.
+        copy: Whether to work on a copy. If False, columns are added
+              to df in place.
     
     Returns:
         DataFrame with added LIN_BODi and LIN_BODe columns.
     """
-    result = df.copy()
-    
-    # linearisation of BOD influent and effluent
-    result["LIN_BODe"] = abs(
-        (df["bod31"] - df["bod31"].min()) / 
-        (df["bod1"].max() - df["bod31"].min())
-    )
-    result["LIN_BODi"] = abs(
-        (df["bod1"] - df["bod31"].min()) / 
-        (df["bod1"].max() - df["bod31"].min())
-    )
+    result = df.copy() if copy else df
+    
+    if stats is None:
+        stats = compute_normalisation_stats(df)
+    bod31_min = stats["bod31_min"]
+    bod_scale = 1.0 / abs(stats["bod1_max"] - bod31_min)
+    
+    # linearisation of BOD influent and effluent. bod31 never drops below
+    # its own minimum, so LIN_BODe needs no abs; LIN_BODi only does if some
+    # influent value lies below that minimum.
+    result["LIN_BODe"] = (df["bod31"] - bod31_min) * bod_scale
+    lin_i = (df["bod1"] - bod31_min) * bod_scale
+    result["LIN_BODi"] = lin_i if stats["bod1_min"] >= bod31_min else lin_i.abs()
     
     return result
 
 
-def linearise_cod(df: pd.DataFrame) -> pd.DataFrame:
+def linearise_cod(
+    df: pd.DataFrame,
+    stats: Optional[Dict[str, float]] = None,
+    copy: bool = True
+) -> pd.DataFrame:
     """
     Apply linearisation to COD influent and effluent data.
     
@@ -45,58 +88,83 @@ def linearise_cod(df: pd.DataFrame) -> pd.DataFrame:
     
     Args:
         df: DataFrame with 'cod1' (influent) and 'cod31' (effluent) columns.
+        stats: Precomputed normalisation bounds from
+               compute_normalisation_stats. Computed from df if None.
+        copy: Whether to work on a copy. If False, columns are added
+              to df in place.
     
     Returns:
         DataFrame with added LIN_CODi and LIN_CODe columns.
     """
-    result = df.copy()
-    
-    # linearisation of COD influent and effluent
-    result["LIN_CODe"] = abs(
-        (df["cod31"] - df["cod31"].min()) / 
-        (df["cod1"].max() - df["cod31"].min())
-    )
-    result["LIN_CODi"] = abs(
-        (df["cod1"] - df["cod31"].min()) / 
-        (df["cod1"].max() - df["cod31"].min())
-    )
+    result = df.copy() if copy else df
+    
+    if stats is None:
+        stats = compute_normalisation_stats(df)
+    cod31_min = stats["cod31_min"]
+    cod_scale = 1.0 / abs(stats["cod1_max"] - cod31_min)
+    
+    # linearisation of COD influent and effluent. cod31 never drops below
+    # its own minimum, so LIN_CODe needs no abs; LIN_CODi only does if some
+    # influent value lies below that minimum.
+    result["LIN_CODe"] = (df["cod31"] - cod31_min) * cod_scale
+    lin_i = (df["cod1"] - cod31_min) * cod_scale
+    result["LIN_CODi"] = lin_i if stats["cod1_min"] >= cod31_min else lin_i.abs()
     
     return result
 
 
-def apply_linearisation(df: pd.DataFrame) -> pd.DataFrame:
+def apply_linearisation(
+    df: pd.DataFrame,
+    stats: Optional[Dict[str, float]] = None,
+    copy: bool = True
+) -> pd.DataFrame:
     """
     Apply linearisation to both BOD and COD data.
     
     Args:
         df: DataFrame with required columns.
+        stats: Precomputed normalisation bounds from
+               compute_normalisation_stats. Computed from df if None.
+        copy: Whether to work on a copy. If False, columns are added
+              to df in place.
     
     Returns:
         DataFrame with all linearisation columns.
     """
-    result = linearise_bod(df)
-    result = linearise_cod(result)
+    if stats is None:
+        stats = compute_normalisation_stats(df)
+    
+    result = linearise_bod(df, stats, copy=copy)
+    result = linearise_cod(result, stats, copy=False)
     
     return result
 
 
-def calculate_deviation_columns(df: pd.DataFrame) -> pd.DataFrame:
+def calculate_deviation_columns(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
     """
     Calculate deviation columns from limits and linearisad values.
     
     Args:
         df: DataFrame with limit and linearisation columns.
+        copy: Whether to work on a copy. If False, columns are added
+              to df in place.
     
     Returns:
         DataFrame with added deviation columns.
     """
-    result = df.copy()
-    
-    # Calculate differences from limits
-    result['BODut-BODeffl'] = (result["BODut"] - result["LIN_BODe"])
-    result['CODut-CODeffl'] = (result["CODut"] - result["LIN_CODe"])
-    result['BODlt-BODeffl'] = (result["BODlt"] - result["LIN_BODe"])
-    result['CODlt-CODeffl'] = (result["CODlt"] - result["LIN_CODe"])
+    result = df.copy() if copy else df
+    
+    # Calculate differences from limits on the raw arrays and insert
+    # the four columns in one assignment
+    lin_bod_e = result["LIN_BODe"].to_numpy()
+    lin_cod_e = result["LIN_CODe"].to_numpy()
+    deviations = {
+        'BODut-BODeffl': result["BODut"].to_numpy() - lin_bod_e,
+        'CODut-CODeffl': result["CODut"].to_numpy() - lin_cod_e,
+        'BODlt-BODeffl': result["BODlt"].to_numpy() - lin_bod_e,
+        'CODlt-CODeffl': result["CODlt"].to_numpy() - lin_cod_e,
+    }
+    result[list(deviations)] = np.column_stack(list(deviations.values()))
     
     return result
 
@@ -104,7 +172,8 @@ def calculate_deviation_columns(df: pd.DataFrame) -> pd.DataFrame:
 def calculate_reduction_columns(
     df: pd.DataFrame,
     bod_pc: float = 0.7,
-    cod_pc: float = 0.75
+    cod_pc: float = 0.75,
+    copy: bool = True
 ) -> pd.DataFrame:
     """
     Calculate reduction (psi) percentage columns.
@@ -113,14 +182,19 @@ def calculate_reduction_columns(
         df: DataFrame with linearisad columns.
         bod_pc: BOD percentage factor.
         cod_pc: COD percentage factor.
+        copy: Whether to work on a copy. If False, columns are added
+              to df in place.
     
     Returns:
         DataFrame with added reduction columns.
     """
-    result = df.copy()
-    
-    # Calculate reduction percentage
-    result["bodp"] = -(bod_pc * result["LIN_BODi"]) + result["LIN_BODi"] - result["LIN_BODe"]
-    result["codp"] = -(cod_pc * result["LIN_CODi"]) + result["LIN_CODi"] - result["LIN_CODe"]
+    result = df.copy() if copy else df
+    
+    # Calculate reduction percentage: -(pc * LINi) + LINi - LINe, folded
+    # into one scale-and-subtract per parameter, reusing a single buffer
+    for param, pc in (("BOD", bod_pc), ("COD", cod_pc)):
+        reduction = np.multiply(result[f"LIN_{param}i"].to_numpy(), 1 - pc)
+        np.subtract(reduction, result[f"LIN_{param}e"].to_numpy(), out=reduction)
+        result[f"{param.lower()}p"] = reduction
     
     return result
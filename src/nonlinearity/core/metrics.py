@@ -8,20 +8,28 @@ from the original notebook.
 import pandas as pd
 import numpy as np
 
-from ..config import ComplianceLimits, REQUIRED_COLUMNS
+from ..config import ComplianceLimits, REQUIRED_COLUMNS, FAIL_TYPES, FAIL_SOURCES
 from ..data.validators import validate_dataframe, check_required_columns
 from .compliance import (
     calculate_all_limits,
     calculate_flag_conditions,
+    failure_masks,
 )
 from .linearisation import (
+    compute_normalisation_stats,
     apply_linearisation,
     calculate_deviation_columns,
     calculate_reduction_columns,
 )
 
 
-def calculate_psi_values(df: pd.DataFrame) -> pd.DataFrame:
+# fail_type and fail_source codes for each failure state:
+# none, BOD LUT, BOD max limit, COD LUT, COD max limit
+_FAIL_TYPE_BY_STATE = np.array([0, 1, 2, 1, 2], dtype=np.int8)
+_FAIL_SOURCE_BY_STATE = np.array([0, 1, 1, 2, 2], dtype=np.int8)
+
+
+def calculate_psi_values(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
     """
     Calculate PSI (Performance Sustainability Index) values for BOD and COD.
     
@@ -29,85 +37,77 @@ def calculate_psi_values(df: pd.DataFrame) -> pd.DataFrame:
         df: DataFrame with deviation columns:
             - BODlt-BODeffl, BODut-BODeffl, bodp
             - CODlt-CODeffl, CODut-CODeffl, codp
+        copy: Whether to work on a copy. If False, columns are added
+              to df in place.
     
     Returns:
         DataFrame with added PSI columns.
     """
-    result = df.copy()
-    
-    # BOD PSI calculations
-    result["bod_psi_1_min"] = result[['BODlt-BODeffl', 'bodp']].min(axis=1)
-    result["bod_psi_1"] = result[['BODlt-BODeffl', 'bod_psi_1_min']].max(axis=1)
-    result["bod_psi_2"] = result[['BODlt-BODeffl', 'bodp', "BODut-BODeffl"]].min(axis=1)
-    result["bod_psi_3"] = result[["BODut-BODeffl", "bodp"]].min(axis=1)
-    
-    # COD PSI calculations
-    result["cod_psi_1_min"] = result[['CODlt-CODeffl', 'codp']].min(axis=1)
-    result["cod_psi_1"] = result[['CODlt-CODeffl', 'cod_psi_1_min']].max(axis=1)
-    result["cod_psi_2"] = result[['CODlt-CODeffl', 'codp', "CODut-CODeffl"]].min(axis=1)
-    result["cod_psi_3"] = result[["CODut-CODeffl", "codp"]].min(axis=1)
+    result = df.copy() if copy else df
+    
+    # Row-wise min/max straight on the column arrays; fmin/fmax skip NaN
+    # like DataFrame.min(axis=1) without building temporary frames
+    for param, prefix in (("BOD", "bod"), ("COD", "cod")):
+        lt_dev = result[f'{param}lt-{param}effl'].to_numpy()
+        ut_dev = result[f'{param}ut-{param}effl'].to_numpy()
+        reduction = result[f'{prefix}p'].to_numpy()
+        
+        psi_1_min = np.fmin(lt_dev, reduction)
+        result[f"{prefix}_psi_1_min"] = psi_1_min
+        result[f"{prefix}_psi_1"] = np.fmax(lt_dev, psi_1_min)
+        result[f"{prefix}_psi_2"] = np.fmin(psi_1_min, ut_dev)
+        result[f"{prefix}_psi_3"] = np.fmin(ut_dev, reduction)
     
     return result
 
 
-def calculate_metric_values(df: pd.DataFrame) -> pd.DataFrame:
+def calculate_metric_values(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
     """
     Calculate metric values (combined PSI metrics).
     
     Args:
         df: DataFrame with PSI columns.
+        copy: Whether to work on a copy. If False, columns are added
+              to df in place.
     
     Returns:
         DataFrame with added metric columns.
     """
-    result = df.copy()
+    result = df.copy() if copy else df
     
     # metric LUT (Look-Up Table)
-    result["metric_lut"] = result[["bod_psi_2", "cod_psi_2"]].min(axis=1)
+    result["metric_lut"] = np.fmin(
+        result["bod_psi_2"].to_numpy(), result["cod_psi_2"].to_numpy()
+    )
     
     # metric MAX
-    result["metric_max"] = result[["bod_psi_3", "cod_psi_3"]].min(axis=1)
+    result["metric_max"] = np.fmin(
+        result["bod_psi_3"].to_numpy(), result["cod_psi_3"].to_numpy()
+    )
     
     return result
 
 
-def determine_failure_type(df: pd.DataFrame) -> pd.DataFrame:
+def determine_failure_type(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
     """
     Determine failure type and source based on conditions.
     
     Args:
         df: DataFrame with metric and flag columns.
+        copy: Whether to work on a copy. If False, columns are added
+              to df in place.
     
     Returns:
         DataFrame with added fail_type and fail_source columns.
     """
-    result = df.copy()
+    result = df.copy() if copy else df
     
     # Define failure conditions
-    bod_lut_exc = (
-        (result['bod_psi_2'] < 0) & 
-        (result["flag_BODlt"] == False) & 
-        (result["flag_reduction_bod"] == False) & 
-        (result["flag_BODut"] == True)
-    )
-    bod_max_lim = (
-        (result['bod_psi_3'] < 0) & 
-        (result["flag_BODlt"] == False) & 
-        (result["flag_BODut"] == False) & 
-        (result["flag_reduction_bod"] == False)
-    )
-    cod_lut_exc = (
-        (result['cod_psi_2'] < 0) & 
-        (result["flag_CODlt"] == False) & 
-        (result["flag_reduction_cod"] == False) & 
-        (result["flag_CODut"] == True)
-    )
-    cod_max_lim = (
-        (result['cod_psi_3'] < 0) & 
-        (result["flag_CODlt"] == False) & 
-        (result["flag_CODut"] == False) & 
-        (result["flag_reduction_cod"] == False)
-    )
+    masks = failure_masks(result)
+    bod_lut_exc = masks["bod_lut_exc"]
+    bod_max_lim = masks["bod_max_lim"]
+    cod_lut_exc = masks["cod_lut_exc"]
+    cod_max_lim = masks["cod_max_lim"]
     
     # Combined conditions
     condition_2 = (bod_lut_exc | cod_lut_exc)
@@ -117,31 +117,38 @@ def determine_failure_type(df: pd.DataFrame) -> pd.DataFrame:
     cond_lut = condition_2 & ~condition_3
     cond_max = condition_2 & condition_3
     
-    choices = [result["metric_lut"], result["metric_max"]]
-    default_val = result[['bod_psi_1', 'cod_psi_1']].max(axis=1)
-    
-    result["metric"] = np.select([cond_lut, cond_max], choices, default=default_val)
-    
-    # Assign fail_type
-    fail_type_conditions = [
-        bod_lut_exc, bod_max_lim,  # BOD conditions
-        cod_lut_exc, cod_max_lim   # COD conditions
-    ]
-    fail_type_values = [
-        "LUT exceedance", "Max Limit Failure",  # BOD fail types
-        "LUT exceedance", "Max Limit Failure"   # COD fail types
-    ]
-    result["fail_type"] = np.select(
-        fail_type_conditions, 
-        fail_type_values, 
-        default="Compliant"
-    )
+    metric_lut = result["metric_lut"].to_numpy()
+    metric_max = result["metric_max"].to_numpy()
+    bod_psi_1 = result['bod_psi_1'].to_numpy()
+    cod_psi_1 = result['cod_psi_1'].to_numpy()
     
-    # Assign fail_source
-    result["fail_source"] = np.select(
-        [bod_lut_exc | bod_max_lim, cod_lut_exc | cod_max_lim],
-        ["BOD", "COD"],
-        default="None"
+    # Fill each branch through its mask so the default is only computed
+    # for rows without a LUT exceedance
+    metric = np.empty(
+        len(result), dtype=np.result_type(metric_lut, metric_max, bod_psi_1, cod_psi_1)
+    )
+    metric[cond_lut] = metric_lut[cond_lut]
+    metric[cond_max] = metric_max[cond_max]
+    np.fmax(bod_psi_1, cod_psi_1, out=metric, where=~condition_2)
+    
+    result["metric"] = metric
+    
+    # Encode the first matching condition (BOD before COD, LUT before
+    # max limit) as a single state; assigning in reverse priority lets
+    # earlier conditions overwrite later ones
+    state = np.zeros(len(result), dtype=np.int8)
+    state[cod_max_lim] = 4
+    state[cod_lut_exc] = 3
+    state[bod_max_lim] = 2
+    state[bod_lut_exc] = 1
+    
+    # Gather fail_type and fail_source codes from the state
+    fail_type_codes = _FAIL_TYPE_BY_STATE[state]
+    result["fail_type"] = pd.Categorical.from_codes(
+        fail_type_codes, categories=FAIL_TYPES
+    )
+    result["fail_source"] = pd.Categorical.from_codes(
+        _FAIL_SOURCE_BY_STATE[state], categories=FAIL_SOURCES
     )
     
     # Store intermediate flags
@@ -150,6 +157,12 @@ def determine_failure_type(df: pd.DataFrame) -> pd.DataFrame:
     result["cod_lut_exc"] = cod_lut_exc
     result["cod_max_lim"] = cod_max_lim
     
+    # Boolean views of fail_type so analyses need not rescan the labels
+    result["is_lut"] = fail_type_codes == 1
+    result["is_max_limit"] = fail_type_codes == 2
+    result["is_failure"] = state != 0
+    result["is_compliant"] = state == 0
+    
     # Additional comparison flags
     result['c_BOD_2'] = result["bod_psi_2"] < result["cod_psi_2"]
     result['c_BOD_3'] = result["bod_psi_3"] < result["cod_psi_3"]
@@ -182,32 +195,39 @@ def process_dataframe(
     # Validate input data
     validate_dataframe(df, REQUIRED_COLUMNS, allow_empty=False)
     
+    # Copy once up front; every step then adds its columns in place
+    result = df.copy()
+    
+    # Normalisation bounds shared by the limit and linearisation steps
+    stats = compute_normalisation_stats(result)
+    
     # Step 1: Calculate limits
-    result = calculate_all_limits(df, limits)
+    result = calculate_all_limits(result, limits, stats, copy=False)
     
     # Step 2: Apply linearisation
-    result = apply_linearisation(result)
+    result = apply_linearisation(result, stats, copy=False)
     
     # Step 3: Calculate deviation columns
-    result = calculate_deviation_columns(result)
+    result = calculate_deviation_columns(result, copy=False)
     
     # Step 4: Calculate reduction columns
     result = calculate_reduction_columns(
         result, 
         limits.bod_pc, 
-        limits.cod_pc
+        limits.cod_pc,
+        copy=False
     )
     
     # Step 5: Calculate flag conditions
-    result = calculate_flag_conditions(result)
+    result = calculate_flag_conditions(result, copy=False)
     
     # Step 6: Calculate PSI values
-    result = calculate_psi_values(result)
+    result = calculate_psi_values(result, copy=False)
     
     # Step 7: Calculate metric values
-    result = calculate_metric_values(result)
+    result = calculate_metric_values(result, copy=False)
     
     # Step 8: Determine failure types
-    result = determine_failure_type(result)
+    result = determine_failure_type(result, copy=False)
     
     return result
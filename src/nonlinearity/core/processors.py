@@ -4,12 +4,21 @@ Main processor module.
 Orchestrates the full data processing pipeline.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, Optional
 
 import pandas as pd
 
-from ..config import ComplianceLimits, ProjectPaths, get_config, SCENARIOS
+from ..config import (
+    ComplianceLimits,
+    ProjectPaths,
+    get_config,
+    SCENARIOS,
+    FAIL_TYPES,
+    FAIL_SOURCES,
+)
+from ..data.categories import count_categories
 from ..data.loaders import load_pickle_file, process_folder
 from ..data.validators import validate_dataframe, check_required_columns
 from ..utils.logging_config import log
@@ -61,14 +70,22 @@ def process_scenario(
 
 def run_full_analysis(
     root_path: Path = None,
-    save_output: bool = True
+    save_output: bool = True,
+    max_workers: Optional[int] = None
 ) -> Dict[str, pd.DataFrame]:
     """
     Run the complete analysis pipeline for all scenarios.
     
+    Scenarios are independent, so with max_workers > 1 they are processed
+    in a process pool. Each result is pickled back to the parent, which
+    only pays off when the scenario folders are large; the bundled data
+    processes faster sequentially.
+    
     Args:
         root_path: Project root path. If None, auto-detected.
         save_output: Whether to save results to CSV.
+        max_workers: Number of worker processes. None or 1 processes
+                     the scenarios sequentially.
     
     Returns:
         Dictionary mapping scenario keys to processed DataFrames.
@@ -78,19 +95,35 @@ def run_full_analysis(
     if save_output:
         paths.ensure_output_dirs()
     
-    results = {}
-    
-    for scenario_key in SCENARIOS.keys():
-        log.info(f"Processing scenario: {scenario_key}")
-        
-        df = process_scenario(
+    scenario_kwargs = {
+        scenario_key: dict(
             scenario_key=scenario_key,
             data_dir=paths.data,
             config=config,
             output_dir=paths.csv_output if save_output else None,
             save_csv=save_output
         )
-        
+        for scenario_key in SCENARIOS.keys()
+    }
+    
+    if max_workers is not None and max_workers > 1:
+        log.info(f"Processing {len(scenario_kwargs)} scenarios with {max_workers} workers")
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                key: executor.submit(process_scenario, **kwargs)
+                for key, kwargs in scenario_kwargs.items()
+            }
+            # Collect in SCENARIOS order so the results stay deterministic
+            frames = {key: future.result() for key, future in futures.items()}
+    else:
+        frames = {}
+        for scenario_key, kwargs in scenario_kwargs.items():
+            log.info(f"Processing scenario: {scenario_key}")
+            frames[scenario_key] = process_scenario(**kwargs)
+    
+    results = {}
+    
+    for scenario_key, df in frames.items():
         if not df.empty:
             results[scenario_key] = df
     
@@ -115,21 +148,24 @@ def get_scenario_summary(
         if df.empty or "fail_type" not in df.columns:
             continue
         
+        type_counts = count_categories(df["fail_type"], FAIL_TYPES)
+        
         row = {
             "Category": scenario_name,
-            "Compliant Count": (df["fail_type"] == "Compliant").sum(),
-            "LUT Exceedance Count": (df["fail_type"] == "LUT exceedance").sum(),
-            "Max Limit Failure Count": (df["fail_type"] == "Max Limit Failure").sum(),
+            "Compliant Count": type_counts["Compliant"],
+            "LUT Exceedance Count": type_counts["LUT exceedance"],
+            "Max Limit Failure Count": type_counts["Max Limit Failure"],
         }
         
         if "fail_source" in df.columns:
-            row["BOD Source Count"] = (df["fail_source"] == "BOD").sum()
-            row["COD Source Count"] = (df["fail_source"] == "COD").sum()
-            row["Pass Source Count"] = (df["fail_source"] == "None").sum()
+            source_counts = count_categories(df["fail_source"], FAIL_SOURCES)
+            row["BOD Source Count"] = source_counts["BOD"]
+            row["COD Source Count"] = source_counts["COD"]
+            row["Pass Source Count"] = source_counts["None"]
         
         if "c_BOD_2" in df.columns:
-            row["BOD 2 Limit"] = (df["c_BOD_2"] == True).sum()
-            row["BOD 3 Limit"] = (df["c_BOD_3"] == True).sum()
+            row["BOD 2 Limit"] = int(df["c_BOD_2"].to_numpy().sum())
+            row["BOD 3 Limit"] = int(df["c_BOD_3"].to_numpy().sum())
         
         summary_data.append(row)
     
@@ -1,12 +1,21 @@
 """Data loading and validation modules."""
 
-from .loaders import load_pickle_file, process_folder, load_all_scenarios
-from .validators import validate_dataframe, check_required_columns
+from .categories import count_categories
+from .loaders import (
+    load_pickle_file,
+    convert_pickle_folder,
+    process_folder,
+    load_all_scenarios,
+)
+from .validators import validate_dataframe, check_required_columns, has_required_columns
 
 __all__ = [
     "load_pickle_file",
+    "convert_pickle_folder",
     "process_folder", 
     "load_all_scenarios",
     "validate_dataframe",
     "check_required_columns",
+    "has_required_columns",
+    "count_categories",
 ]
@@ -0,0 +1,41 @@
+"""
+Counting helpers for categorical columns such as fail_type.
+
+Kept in the data layer so loaders, core and visualisation can all
+import it without a circular import.
+"""
+
+from typing import Dict, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+def count_categories(
+    series: pd.Series,
+    categories: Sequence[str]
+) -> Dict[str, int]:
+    """
+    Count occurrences of each category in a series.
+    
+    Categorical series with matching categories are counted from their
+    integer codes in a single np.bincount; other series use value_counts.
+    
+    Args:
+        series: Series of category values (e.g. fail_type).
+        categories: Categories to count, e.g. FAIL_TYPES.
+    
+    Returns:
+        Dictionary mapping each category to its count.
+    """
+    if (
+        isinstance(series.dtype, pd.CategoricalDtype)
+        and tuple(series.cat.categories) == tuple(categories)
+    ):
+        # Shift by one so missing values (code -1) land in a dropped bin
+        codes = series.cat.codes.to_numpy().astype(np.intp) + 1
+        counts = np.bincount(codes, minlength=len(categories) + 1)[1:]
+        return dict(zip(categories, counts.tolist()))
+    
+    value_counts = series.value_counts()
+    return {cat: int(value_counts.get(cat, 0)) for cat in categories}
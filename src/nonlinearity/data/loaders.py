@@ -5,13 +5,26 @@ This module extracts the data loading logic from the original notebook.
 """
 
 import os
+import pickle
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Union
 
+import numpy as np
 import pandas as pd
+from pandas.api.extensions import ExtensionArray, ExtensionDtype
 
-from ..config import ComplianceLimits, SCENARIOS
+from ..config import (
+    ComplianceLimits,
+    SCENARIOS,
+    CONCENTRATION_COLUMNS,
+    FAIL_TYPES,
+    FAIL_SOURCES,
+)
 from ..utils.logging_config import log
+from .categories import count_categories
 
 
 def load_pickle_file(file_path: Path) -> Optional[pd.DataFrame]:
@@ -35,10 +48,143 @@ def load_pickle_file(file_path: Path) -> Optional[pd.DataFrame]:
         return None
 
 
+def _pickle_files(folder_path: Path) -> List[Path]:
+    """
+    List the pickle files in a folder, in directory order.
+    
+    Uses os.scandir, which yields the entry type without a stat call.
+    
+    Args:
+        folder_path: Folder to list.
+    
+    Returns:
+        Paths of the .pkl files in the folder.
+    """
+    with os.scandir(folder_path) as entries:
+        return [
+            Path(entry.path) for entry in entries
+            if entry.name.endswith(".pkl") and entry.is_file(follow_symlinks=False)
+        ]
+
+
+def convert_pickle_folder(
+    folder_path: Path,
+    output_dir: Optional[Path] = None
+) -> int:
+    """
+    Rewrite a folder's pickles with numeric columns.
+    
+    Older simulation profiles store every column as object dtype, which
+    unpickles one Python float at a time. Converting them once to
+    float64 columns (pickle protocol 5) lets later loads copy each
+    column as a single buffer.
+    
+    Each file is written to a temporary file and then moved over its
+    target, so an interrupted run never leaves a partly written pickle.
+    
+    Args:
+        folder_path: Path to the folder containing pickle files.
+        output_dir: Folder to write the converted copies to. Files that
+                    need no conversion are copied unchanged. If None,
+                    the pickles in folder_path are replaced.
+    
+    Returns:
+        Number of files converted.
+    """
+    folder_path = Path(folder_path)
+    target_dir = Path(output_dir) if output_dir else folder_path
+    target_dir.mkdir(parents=True, exist_ok=True)
+    converted = 0
+    
+    for file_path in _pickle_files(folder_path):
+        target_path = target_dir / file_path.name
+        data_file = load_pickle_file(file_path)
+        
+        if data_file is None or not (data_file.dtypes == object).any():
+            if target_path != file_path:
+                shutil.copy2(file_path, target_path)
+            continue
+        
+        fd, tmp_name = tempfile.mkstemp(dir=target_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            data_file.infer_objects().to_pickle(
+                tmp_name, protocol=pickle.HIGHEST_PROTOCOL
+            )
+            os.replace(tmp_name, target_path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        converted += 1
+    
+    log.info(f"Converted {converted} pickle files from {folder_path} into {target_dir}")
+    return converted
+
+
+def _concat_columns(
+    columns: Dict[str, List[Optional[Union[np.ndarray, ExtensionArray]]]],
+    lengths: List[int],
+    dtypes: Optional[Dict[str, np.dtype]] = None
+) -> pd.DataFrame:
+    """
+    Build a single DataFrame from per-file column arrays.
+    
+    Each column is joined with one np.concatenate, so the combined frame
+    is allocated once per column instead of going through pd.concat.
+    Files that lack a float column contribute NaN. Extension-dtype
+    columns (tz-aware datetimes, categoricals, nullable ints) and other
+    columns with gaps are joined through pd.concat, so they keep the
+    missing values and dtype it would give them.
+    
+    Args:
+        columns: Mapping of column name to one array (or None) per file;
+                 extension-dtype columns are passed as their ExtensionArray.
+        lengths: Number of rows contributed by each file.
+        dtypes: Optional target dtypes per column. The cast happens while
+                concatenating, so no second copy of the column is made.
+    
+    Returns:
+        Combined DataFrame with a fresh RangeIndex.
+    """
+    dtypes = dtypes or {}
+    data = {}
+    
+    for col, parts in columns.items():
+        present = [part for part in parts if part is not None]
+        
+        has_extension = any(not isinstance(part, np.ndarray) for part in present)
+        has_gaps = len(present) < len(parts)
+        
+        if has_extension or (has_gaps and not all(
+            part.dtype.kind in "fc" for part in present
+        )):
+            combined = pd.concat(
+                [
+                    pd.DataFrame(index=pd.RangeIndex(n)) if part is None
+                    else pd.DataFrame({col: part})
+                    for part, n in zip(parts, lengths)
+                ],
+                ignore_index=True
+            )[col]
+            data[col] = combined.astype(dtypes[col]) if col in dtypes else combined
+            continue
+        
+        data[col] = np.concatenate(
+            [
+                np.full(n, np.nan) if part is None else part
+                for part, n in zip(parts, lengths)
+            ],
+            dtype=dtypes.get(col),
+            casting="unsafe"
+        )
+    
+    return pd.DataFrame(data, copy=False)
+
+
 def process_folder(
     folder_path: Path,
     compliance_limits: ComplianceLimits,
-    save_csv: bool = True,
+    save_csv: bool = False,
     output_dir: Optional[Path] = None
 ) -> pd.DataFrame:
     """
@@ -50,13 +196,15 @@ def process_folder(
     Args:
         folder_path: Path to the folder containing pickle files.
         compliance_limits: Compliance limits for calculations.
-        save_csv: Whether to save individual CSV files.
+        save_csv: Whether to save the combined data as <folder>_full.csv.
         output_dir: Directory for CSV output. If None, saves to folder_path.
     
     Returns:
         Combined DataFrame with all processed data.
     """
-    data_folder = []
+    # Column arrays per file, accumulated without keeping the frames
+    data_columns: Dict[str, List[Optional[Union[np.ndarray, ExtensionArray]]]] = {}
+    data_lengths: List[int] = []
     
     # Handle both string and Path inputs
     if isinstance(folder_path, str):
@@ -66,42 +214,52 @@ def process_folder(
         log.warning(f"Folder {folder_path} does not exist")
         return pd.DataFrame()
     
-    for filename in os.listdir(folder_path):
-        # Skip non-Pickle files
-        if not filename.endswith(".pkl"):
-            continue
-        
-        file_path = folder_path / filename
-        
-        data_file = load_pickle_file(file_path)
-        
-        if data_file is None:
-            continue
-        
-        if data_file.empty:
-            log.warning(f"Empty DataFrame in file {file_path}")
-            continue
-        
-        # Append to accumulated data
-        data_folder.append(data_file)
+    file_paths = _pickle_files(folder_path)
+    
+    if not file_paths:
+        log.warning(f"No data to return for folder {folder_path}")
+        return pd.DataFrame()
+    
+    # Overlap file reads across threads; map keeps the directory order
+    max_workers = min(32, len(file_paths), (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        data_files = executor.map(load_pickle_file, file_paths)
         
-        # Save individual file CSV if requested
-        if save_csv:
-            csv_name = file_path.stem  # filename without extension
-            output_path = output_dir if output_dir else folder_path
-            data_file.to_csv(output_path / f"{csv_name}.csv", index=False)
+        for file_path, data_file in zip(file_paths, data_files):
+            if data_file is None:
+                continue
+            
+            if data_file.empty:
+                log.warning(f"Empty DataFrame in file {file_path}")
+                continue
+            
+            # Append to accumulated data
+            for col in data_columns.keys() - set(data_file.columns):
+                data_columns[col].append(None)
+            for col, dtype in data_file.dtypes.items():
+                series = data_file[col]
+                data_columns.setdefault(col, [None] * len(data_lengths)).append(
+                    series.array if isinstance(dtype, ExtensionDtype)
+                    else series.to_numpy()
+                )
+            data_lengths.append(len(data_file))
     
     # Return the concatenated results from all the files in the folder
-    if not data_folder:
+    if not data_lengths:
         log.warning(f"No data to return for folder {folder_path}")
         return pd.DataFrame()
     
-    result_df = pd.concat(data_folder, ignore_index=True)
+    # Halve the memory and bandwidth of the concentration columns
+    result_df = _concat_columns(
+        data_columns,
+        data_lengths,
+        dtypes={col: np.float32 for col in CONCENTRATION_COLUMNS}
+    )
     
-    # Save full combined CSV
-    if save_csv and output_dir:
-        csv_name = folder_path.name
-        result_df.to_csv(output_dir / f"{csv_name}_full.csv", index=False)
+    # Save one combined CSV rather than a sidecar per pickle
+    if save_csv:
+        output_path = output_dir if output_dir else folder_path
+        result_df.to_csv(output_path / f"{folder_path.name}_full.csv", index=False)
     
     return result_df
 
@@ -109,7 +267,8 @@ def process_folder(
 def load_all_scenarios(
     compliance_limits: ComplianceLimits,
     data_dir: Path,
-    output_dir: Optional[Path] = None
+    output_dir: Optional[Path] = None,
+    save_csv: bool = False
 ) -> Dict[str, pd.DataFrame]:
     """
     Load and process all scenario folders.
@@ -118,6 +277,7 @@ def load_all_scenarios(
         compliance_limits: Compliance limits for calculations.
         data_dir: Path to the data directory containing scenario subfolders.
         output_dir: Optional output directory for CSV files.
+        save_csv: Whether to save a combined CSV per scenario folder.
     
     Returns:
         Dictionary mapping scenario names to processed DataFrames.
@@ -131,7 +291,7 @@ def load_all_scenarios(
         df = process_folder(
             folder_path, 
             compliance_limits,
-            save_csv=True,
+            save_csv=save_csv,
             output_dir=output_dir
         )
         
@@ -158,19 +318,22 @@ def get_data_summary(results: Dict[str, pd.DataFrame]) -> pd.DataFrame:
     for scenario_name, df in results.items():
         if df.empty or "fail_type" not in df.columns:
             continue
-            
+        
+        type_counts = count_categories(df["fail_type"], FAIL_TYPES)
+        
         row = {
             "Scenario": scenario_name,
             "Total Records": len(df),
-            "Compliant": (df["fail_type"] == "Compliant").sum(),
-            "LUT Exceedance": (df["fail_type"] == "LUT exceedance").sum(),
-            "Max Limit Failure": (df["fail_type"] == "Max Limit Failure").sum(),
+            "Compliant": type_counts["Compliant"],
+            "LUT Exceedance": type_counts["LUT exceedance"],
+            "Max Limit Failure": type_counts["Max Limit Failure"],
         }
         
         if "fail_source" in df.columns:
-            row["BOD Source"] = (df["fail_source"] == "BOD").sum()
-            row["COD Source"] = (df["fail_source"] == "COD").sum()
-            row["Pass Source"] = (df["fail_source"] == "None").sum()
+            source_counts = count_categories(df["fail_source"], FAIL_SOURCES)
+            row["BOD Source"] = source_counts["BOD"]
+            row["COD Source"] = source_counts["COD"]
+            row["Pass Source"] = source_counts["None"]
         
         summary_data.append(row)
     
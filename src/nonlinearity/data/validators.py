@@ -4,7 +4,8 @@ Data validation functions.
 Provides validation for DataFrames and required columns.
 """
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 import pandas as pd
 
@@ -16,6 +17,34 @@ class DataValidationError(Exception):
     pass
 
 
+@lru_cache(maxsize=32)
+def _missing_columns(
+    columns: Tuple[str, ...],
+    required_columns: Tuple[str, ...]
+) -> Tuple[str, ...]:
+    """
+    Return the required columns absent from a column schema.
+    
+    Memoised on the schema, so frames with the same columns (e.g. every
+    chunk of one ingest) are only checked once.
+    
+    Args:
+        columns: Column names of the DataFrame.
+        required_columns: Required column names.
+    
+    Returns:
+        Missing column names, in required_columns order.
+    """
+    present = frozenset(columns)
+    return tuple(col for col in required_columns if col not in present)
+
+
+@lru_cache(maxsize=None)
+def _is_numeric_dtype(dtype) -> bool:
+    """Cached is_numeric_dtype; frames usually share a handful of dtypes."""
+    return pd.api.types.is_numeric_dtype(dtype)
+
+
 def check_required_columns(
     df: pd.DataFrame,
     required_columns: List[str] = None,
@@ -36,7 +65,7 @@ def check_required_columns(
     if required_columns is None:
         required_columns = REQUIRED_COLUMNS
     
-    missing = [col for col in required_columns if col not in df.columns]
+    missing = list(_missing_columns(tuple(df.columns), tuple(required_columns)))
     
     if missing and raise_error:
         raise DataValidationError(
@@ -47,6 +76,29 @@ def check_required_columns(
     return missing
 
 
+def has_required_columns(
+    df: pd.DataFrame,
+    required_columns: List[str] = None
+) -> bool:
+    """
+    Check whether a DataFrame has all required columns.
+    
+    Shares the memoised schema check with check_required_columns.
+    
+    Args:
+        df: DataFrame to check.
+        required_columns: List of required column names.
+                         Defaults to REQUIRED_COLUMNS from config.
+    
+    Returns:
+        True if every required column is present.
+    """
+    if required_columns is None:
+        required_columns = REQUIRED_COLUMNS
+    
+    return not _missing_columns(tuple(df.columns), tuple(required_columns))
+
+
 def validate_dataframe(
     df: pd.DataFrame,
     required_columns: List[str] = None,
@@ -72,8 +124,9 @@ def validate_dataframe(
     if not allow_empty and df.empty:
         raise DataValidationError("DataFrame is empty")
     
-    missing = check_required_columns(df, required_columns)
-    if missing:
+    # Only build the list of missing columns when reporting an error
+    if not has_required_columns(df, required_columns):
+        missing = check_required_columns(df, required_columns)
         raise DataValidationError(f"Missing required columns: {missing}")
     
     return True
@@ -93,20 +146,24 @@ def validate_numeric_columns(
         allow_na: Whether to allow NA/NaN values.
     
     Returns:
-        List of columns with non-numeric data. Empty if all valid.
+        List of columns with non-numeric data, or with NA values when
+        allow_na is False. Empty if all valid.
     """
     invalid = []
+    present = set(df.columns)
     
     for col in columns:
-        if col not in df.columns:
+        if col not in present:
             continue
         
-        # Check if column can be converted to numeric
-        if not pd.api.types.is_numeric_dtype(df[col]):
+        # Check the dtype only; no need to touch the values
+        if not _is_numeric_dtype(df[col].dtype):
+            invalid.append(col)
+            continue
+        
+        # Only scan for NA values when they are not allowed
+        if not allow_na and df[col].hasnans:
             invalid.append(col)
-        elif not allow_na and df[col].isna().any():
-            # Check for NaN values if not allowed
-            pass  # NaN is valid for numeric columns
     
     return invalid
 
@@ -121,21 +178,22 @@ def get_data_quality_report(df: pd.DataFrame) -> dict:
     Returns:
         Dictionary with data quality metrics.
     """
+    # Count nulls for every column in one reduction over the mask
+    null_counts = df.isna().to_numpy().sum(axis=0)
+    
     report = {
         "total_rows": len(df),
         "total_columns": len(df.columns),
-        "missing_columns": check_required_columns(df),
-        "null_counts": df.isnull().sum().to_dict(),
+        "missing_columns": [] if has_required_columns(df) else check_required_columns(df),
+        "null_counts": dict(zip(df.columns, null_counts.tolist())),
         "numeric_columns": [
-            col for col in df.columns 
-            if pd.api.types.is_numeric_dtype(df[col])
+            col for col, dtype in df.dtypes.items()
+            if _is_numeric_dtype(dtype)
         ],
     }
     
     # Check for columns from original notebook that we expect
     expected_cols = ['bod1', 'cod1', 'bod31', 'cod31']
-    report["has_expected_columns"] = all(
-        col in df.columns for col in expected_cols
-    )
+    report["has_expected_columns"] = has_required_columns(df, expected_cols)
     
     return report
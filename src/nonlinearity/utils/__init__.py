@@ -1,15 +1,30 @@
-"""Utility modules."""
-
-from .file_helpers import ensure_dir, get_output_path
-from .decorators import timer, log_calls
-from .logging_config import setup_logging, get_logger, log
-
-__all__ = [
-    "ensure_dir",
-    "get_output_path",
-    "timer",
-    "log_calls",
-    "setup_logging",
-    "get_logger",
-    "log",
-]
+"""Utility modules.
+
+Submodules are imported on first attribute access (PEP 562).
+"""
+
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "ensure_dir": ".file_helpers",
+    "get_output_path": ".file_helpers",
+    "timer": ".decorators",
+    "log_calls": ".decorators",
+    "setup_logging": ".logging_config",
+    "get_logger": ".logging_config",
+    "log": ".logging_config",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
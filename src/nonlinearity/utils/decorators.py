@@ -5,26 +5,41 @@ Common decorators for timing and logging.
 """
 
 import functools
+import os
 import time
 from typing import Callable
 
+from .logging_config import log
+
+# Instrumentation is opt-in: with NONLIN_TIMING unset, timer and log_calls
+# return the function unchanged so decorated calls carry no overhead. When
+# enabled they log at INFO, the level of the sinks set up by setup_logging
+_TIMING_ENABLED = os.environ.get("NONLIN_TIMING", "0") == "1"
+
 
 def timer(func: Callable) -> Callable:
     """
     Decorator to measure function execution time.
     
+    Only active when the NONLIN_TIMING environment variable is "1" at
+    import time; otherwise func is returned as is.
+    
     Args:
         func: Function to time.
     
     Returns:
         Wrapped function.
     """
+    if not _TIMING_ENABLED:
+        return func
+    
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start = time.time()
+        # Monotonic, nanosecond-resolution clock; converted only for display
+        start = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        elapsed = time.time() - start
-        print(f"{func.__name__} took {elapsed:.2f} seconds")
+        elapsed = (time.perf_counter_ns() - start) / 1e9
+        log.info(f"{func.__name__} took {elapsed:.6f} seconds")
         return result
     return wrapper
 
@@ -33,17 +48,23 @@ def log_calls(func: Callable) -> Callable:
     """
     Decorator to log function calls.
     
+    Only active when the NONLIN_TIMING environment variable is "1" at
+    import time; otherwise func is returned as is.
+    
     Args:
         func: Function to log.
     
     Returns:
         Wrapped function.
     """
+    if not _TIMING_ENABLED:
+        return func
+    
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        print(f"Calling {func.__name__}")
+        log.info(f"Calling {func.__name__}")
         result = func(*args, **kwargs)
-        print(f"{func.__name__} completed")
+        log.info(f"{func.__name__} completed")
         return result
     return wrapper
 
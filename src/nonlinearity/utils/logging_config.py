@@ -5,6 +5,7 @@ Provides centralized logging setup for the project.
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 from loguru import logger
 
@@ -53,16 +54,20 @@ def setup_logging(
             level=level,
             rotation="10 MB",
             retention="7 days",
-            compression="zip",
+            compression="gz",
         )
     
     logger.info(f"Logging initialized at {level} level")
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str = None):
     """
     Get a logger instance.
     
+    Bound loggers are cached per name. They share loguru's handlers, so
+    a cached logger still follows later setup_logging calls.
+    
     Args:
         name: Optional name for the logger.
     
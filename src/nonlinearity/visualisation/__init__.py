@@ -1,16 +1,32 @@
-"""visualisation modules."""
-
-from .plots import setup_matplotlib, save_figure
-from .scatter import plot_influent_effluent
-from .histograms import plot_concentration_histogram
-from .charts import plot_comparison_bars, plot_recovery_histogram, plot_metric_histogram
-
-__all__ = [
-    "setup_matplotlib",
-    "save_figure",
-    "plot_influent_effluent",
-    "plot_concentration_histogram",
-    "plot_comparison_bars",
-    "plot_recovery_histogram",
-    "plot_metric_histogram",
-]
+"""visualisation modules.
+
+Submodules are imported on first attribute access (PEP 562), so importing
+the package does not pull in matplotlib until a plot function is used.
+"""
+
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY = {
+    "setup_matplotlib": ".plots",
+    "save_figure": ".plots",
+    "plot_shared_histograms": ".plots",
+    "plot_influent_effluent": ".scatter",
+    "plot_concentration_histogram": ".histograms",
+    "plot_comparison_bars": ".charts",
+    "plot_recovery_histogram": ".charts",
+    "plot_metric_histogram": ".charts",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -11,7 +11,29 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
+from ..config import FAIL_TYPES
+from ..data.categories import count_categories
+from ..utils.file_helpers import ensure_dir
 from ..utils.logging_config import log
+from .plots import (
+    setup_matplotlib,
+    plot_shared_histograms,
+    scenarios_with_column,
+)
+
+
+def _as_category(series: pd.Series) -> pd.Series:
+    """
+    Return a fail_type series as a categorical over FAIL_TYPES.
+    
+    Frames from process_dataframe are already categorical and are
+    returned unchanged; string columns (e.g. reloaded from CSV) are
+    converted once so counting and comparisons work on int8 codes.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series
+    
+    return series.astype(pd.CategoricalDtype(FAIL_TYPES))
 
 
 def plot_comparison_bars(
@@ -38,16 +60,16 @@ def plot_comparison_bars(
     lut = []
     max_lim = []
     
-    for scenario_name, df in results.items():
-        if df.empty or "fail_type" not in df.columns:
-            continue
+    for scenario_name, df in scenarios_with_column(results, "fail_type").items():
+        # One counting pass per scenario instead of a scan per label
+        counts = count_categories(_as_category(df["fail_type"]), FAIL_TYPES)
         
         categories.append(scenario_name)
-        compliant.append((df["fail_type"] == "Compliant").sum())
-        lut.append((df["fail_type"] == "LUT exceedance").sum())
-        max_lim.append((df["fail_type"] == "Max Limit Failure").sum())
+        compliant.append(counts["Compliant"])
+        lut.append(counts["LUT exceedance"])
+        max_lim.append(counts["Max Limit Failure"])
     
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = setup_matplotlib((10, 6), show=show)
     
     x = np.arange(len(categories))
     width = 0.25
@@ -64,10 +86,8 @@ def plot_comparison_bars(
     ax.legend()
     ax.grid(True, alpha=0.3, axis='y')
     
-    plt.tight_layout()
-    
     if save and output_dir:
-        output_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(output_dir)
         filepath = output_dir / "compliance_comparison.png"
         fig.savefig(filepath, dpi=150, bbox_inches='tight')
         log.info(f"Saved: {filepath}")
@@ -102,20 +122,18 @@ def plot_recovery_histogram(
     """
     from ..analysis.recovery import compute_recovery_time_minutes
     
-    fig, ax = plt.subplots(figsize=(12, 8))
+    fig, ax = setup_matplotlib((12, 8), show=show)
     
-    for scenario_name, df in results.items():
-        if df.empty or "fail_type" not in df.columns:
-            continue
-        
-        recovery_times = compute_recovery_time_minutes(df["fail_type"], time_step) 
-        
-        ax.hist(
-            recovery_times , 
-            bins=bins, 
-            alpha=0.5, 
-            label=f'{scenario_name}'
+    # Collect every scenario first so all histograms share one set of edges
+    recovery_times = {
+        f'{scenario_name}': np.asarray(
+            compute_recovery_time_minutes(_as_category(df["fail_type"]), time_step),
+            dtype=float
         )
+        for scenario_name, df in scenarios_with_column(results, "fail_type").items()
+    }
+    
+    plot_shared_histograms(ax, recovery_times, bins=bins, alpha=0.5)
     
     ax.set_xlabel('Recovery Time (hours)')
     ax.set_ylabel('Frequency')
@@ -123,10 +141,8 @@ def plot_recovery_histogram(
     ax.legend()
     ax.set_ylim(0, 10)
     
-    plt.tight_layout()
-    
     if save and output_dir:
-        output_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(output_dir)
         filepath = output_dir / "recovery_histogram.png"
         fig.savefig(filepath, dpi=150, bbox_inches='tight')
         log.info(f"Saved: {filepath}")
@@ -162,15 +178,14 @@ def plot_mean_recovery_time(
     scenarios = []
     mean_times = []
     
-    for scenario_name, df in results.items():
-        if df.empty or "fail_type" not in df.columns:
-            continue
-        
+    for scenario_name, df in scenarios_with_column(results, "fail_type").items():
         scenarios.append(scenario_name)
-        mean_times.append(compute_mean_recovery_time(df["fail_type"], time_step))
+        mean_times.append(
+            compute_mean_recovery_time(_as_category(df["fail_type"]), time_step)
+        )
     mean_times_div_60 = [mean_times / 60 for mean_times in mean_times]
         
-    fig, ax = plt.subplots(figsize=(8, 5))
+    fig, ax = setup_matplotlib((8, 5), show=show)
     
     ax.plot(scenarios, mean_times_div_60, marker='o')
     ax.set_xlabel('Scenario')
@@ -182,10 +197,8 @@ def plot_mean_recovery_time(
     for x, y in zip(scenarios, mean_times_div_60):
         ax.text(x, y, f'{y:.2f} hours', ha='center', va='bottom')
     
-    plt.tight_layout()
-    
     if save and output_dir:
-        output_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(output_dir)
         filepath = output_dir / "mean_recovery.png"
         fig.savefig(filepath, dpi=150, bbox_inches='tight')
         log.info(f"Saved: {filepath}")
@@ -218,18 +231,17 @@ def plot_metric_histogram(
     Returns:
         Matplotlib figure.
     """
-    fig, ax = plt.subplots(figsize=(12, 8))
-    
-    for scenario_name, df in results.items():
-        if df.empty or "metric" not in df.columns:
-            continue
-        
-        ax.hist(
-            df["metric"], 
-            bins=bins, 
-            alpha=0.5, 
-            label=f'{scenario_name}'
-        )
+    fig, ax = setup_matplotlib((12, 8), show=show)
+    
+    # Histograms on bin edges shared by all scenarios
+    plot_shared_histograms(
+        ax,
+        {
+            f'{scenario_name}': df["metric"].to_numpy(dtype=float)
+            for scenario_name, df in scenarios_with_column(results, "metric").items()
+        },
+        bins=bins
+    )
     
     ax.set_xlabel('Metric')
     ax.set_ylabel('Frequency')
@@ -239,10 +251,8 @@ def plot_metric_histogram(
     if xlim:
         ax.set_xlim(xlim)
     
-    plt.tight_layout()
-    
     if save and output_dir:
-        output_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(output_dir)
         filepath = output_dir / "metric_histogram.png"
         fig.savefig(filepath, dpi=150, bbox_inches='tight')
         log.info(f"Saved: {filepath}")
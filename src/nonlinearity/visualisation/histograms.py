@@ -4,6 +4,7 @@ Histogram plotting functions.
 Concentration distribution plots.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 
@@ -11,7 +12,13 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
+from ..utils.file_helpers import ensure_dir
 from ..utils.logging_config import log
+from .plots import (
+    setup_matplotlib,
+    plot_shared_histograms,
+    scenarios_with_column,
+)
 
 
 def plot_concentration_histogram(
@@ -23,7 +30,8 @@ def plot_concentration_histogram(
     save: bool = True,
     show: bool = True,
     bins: int = 50,
-    xlim: tuple = None
+    xlim: tuple = None,
+    _dir_ready: bool = False
 ) -> plt.Figure:
     """
     Plot histogram of concentration values across scenarios.
@@ -38,27 +46,25 @@ def plot_concentration_histogram(
         show: Whether to display the plot.
         bins: Number of histogram bins.
         xlim: X-axis limits as (min, max).
+        _dir_ready: Skip creating output_dir; set by
+                    plot_all_concentration_histograms, which creates it once.
     
     Returns:
         Matplotlib figure.
     """
-    fig, ax = plt.subplots(figsize=(12, 8))
+    fig, ax = setup_matplotlib((12, 8), show=show)
     
-    for scenario_name, df in results.items():
-        if df.empty or column not in df.columns:
-            continue
-        
-        # Calculate probability
-        count_above = (df[column] > threshold).sum()
-        prob = count_above / len(df[column])
+    data = {}
+    
+    for scenario_name, df in scenarios_with_column(results, column).items():
+        # Calculate probability on the raw array, reused for the histogram
+        values = df[column].to_numpy(dtype=float)
+        prob = np.count_nonzero(values > threshold) / values.size
         
-        ax.hist(
-            df[column], 
-            bins=bins, 
-            density=True, 
-            alpha=0.5, 
-            label=f'{label_prefix} {scenario_name} (Prob > {threshold} = {prob:.2f})'
-        )
+        data[f'{label_prefix} {scenario_name} (Prob > {threshold} = {prob:.2f})'] = values
+    
+    # Histograms on bin edges shared by all scenarios
+    plot_shared_histograms(ax, data, bins=bins, density=True)
     
     # Add threshold line
     ax.axvline(x=threshold, color='r', linestyle='--', linewidth=1)
@@ -71,10 +77,9 @@ def plot_concentration_histogram(
     if xlim:
         ax.set_xlim(xlim)
     
-    plt.tight_layout()
-    
     if save and output_dir:
-        output_dir.mkdir(parents=True, exist_ok=True)
+        if not _dir_ready:
+            ensure_dir(output_dir)
         filepath = output_dir / f"histogram_{column}.png"
         fig.savefig(filepath, dpi=150, bbox_inches='tight')
         log.info(f"Saved: {filepath}")
@@ -88,7 +93,9 @@ def plot_concentration_histogram(
 def plot_all_concentration_histograms(
     results: Dict[str, pd.DataFrame],
     output_dir: Optional[Path] = None,
-    save: bool = True
+    save: bool = True,
+    show: bool = True,
+    max_workers: Optional[int] = None
 ) -> Dict[str, plt.Figure]:
     """
     Plot all concentration histograms.
@@ -97,12 +104,14 @@ def plot_all_concentration_histograms(
         results: Dictionary of scenario DataFrames.
         output_dir: Directory to save plots.
         save: Whether to save plots.
+        show: Whether to keep the figures open for display.
+        max_workers: Number of worker processes used to render the
+                     figures when show is False. None or 1 renders them
+                     sequentially.
     
     Returns:
         Dictionary of figures.
     """
-    figures = {}
-    
     # Define columns and thresholds
     configs = [
         ('bod1', 300, 'BOD infl'),
@@ -111,16 +120,42 @@ def plot_all_concentration_histograms(
         ('cod31', 250, 'COD effl'),
     ]
     
-    for column, threshold, label in configs:
-        fig = plot_concentration_histogram(
-            results, 
-            column, 
-            threshold,
+    # Create the output directory once for all four figures
+    if save and output_dir:
+        ensure_dir(output_dir)
+    
+    plot_kwargs = {
+        column: dict(
+            column=column,
+            threshold=threshold,
             label_prefix=label,
             output_dir=output_dir,
             save=save,
-            xlim=(0, threshold * 2) if 'effl' in column else None
+            show=show,
+            xlim=(0, threshold * 2) if 'effl' in column else None,
+            _dir_ready=True
         )
-        figures[column] = fig
+        for column, threshold, label in configs
+    }
+    
+    # Figures rendered in other processes cannot be shown here
+    if show or max_workers is None or max_workers <= 1:
+        return {
+            column: plot_concentration_histogram(results, **kwargs)
+            for column, kwargs in plot_kwargs.items()
+        }
     
-    return figures
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            # Send each worker only the column it plots
+            column: executor.submit(
+                plot_concentration_histogram,
+                {
+                    name: df[[column]] for name, df in results.items()
+                    if column in df.columns
+                },
+                **kwargs
+            )
+            for column, kwargs in plot_kwargs.items()
+        }
+        return {column: future.result() for column, future in futures.items()}
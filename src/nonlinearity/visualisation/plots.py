@@ -4,34 +4,84 @@ Base plotting utilities.
 Common setup and helper functions for matplotlib.
 """
 
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
+
+import matplotlib
+
+# Headless batch runs only save PNGs; skip GUI backend start-up
+if os.environ.get("NONLIN_HEADLESS", "0") == "1":
+    matplotlib.use("Agg")
 
 import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
+from ..utils.file_helpers import ensure_dir
 from ..utils.logging_config import log
 
 
-def setup_matplotlib(figsize: tuple = (10, 6)) -> tuple:
+def setup_matplotlib(
+    figsize: tuple = (10, 6),
+    nrows: int = 1,
+    ncols: int = 1,
+    show: bool = True
+) -> tuple:
     """
     Setup matplotlib figure and axis.
     
+    Figures that will not be shown are created directly on an Agg
+    canvas, without registering a pyplot figure manager, so they are
+    freed as soon as they go out of scope.
+    
     Args:
         figsize: Figure size as (width, height).
+        nrows: Number of subplot rows.
+        ncols: Number of subplot columns.
+        show: Whether the figure will be displayed.
     
     Returns:
-        Tuple of (figure, axis).
+        Tuple of (figure, axis or array of axes).
     """
-    fig, ax = plt.subplots(figsize=figsize)
+    if show:
+        return plt.subplots(nrows, ncols, figsize=figsize, layout="constrained")
+    
+    fig = Figure(figsize=figsize, layout="constrained")
+    FigureCanvasAgg(fig)
+    ax = fig.subplots(nrows, ncols)
     return fig, ax
 
 
+def scenarios_with_column(
+    results: Dict[str, pd.DataFrame],
+    column: str
+) -> Dict[str, pd.DataFrame]:
+    """
+    Select the non-empty scenario DataFrames that contain a column.
+    
+    Args:
+        results: Dictionary of scenario DataFrames.
+        column: Column the plot needs.
+    
+    Returns:
+        Filtered dictionary, in the original scenario order.
+    """
+    return {
+        name: df for name, df in results.items()
+        if not df.empty and column in df.columns
+    }
+
+
 def save_figure(
     fig,
     filename: str,
     output_dir: Optional[Path] = None,
     dpi: int = 150,
-    bbox_inches: str = 'tight'
+    bbox_inches: str = 'tight',
+    _dir_ready: bool = False
 ) -> Path:
     """
     Save figure to file.
@@ -42,12 +92,15 @@ def save_figure(
         output_dir: Output directory. If None, uses current directory.
         dpi: Resolution in dots per inch.
         bbox_inches: Bounding box setting.
+        _dir_ready: Skip creating output_dir; set by the plot_all_*
+                    drivers, which create it once.
     
     Returns:
         Path to saved file.
     """
     if output_dir:
-        output_dir.mkdir(parents=True, exist_ok=True)
+        if not _dir_ready:
+            ensure_dir(output_dir)
         filepath = output_dir / filename
     else:
         filepath = Path(filename)
@@ -58,6 +111,50 @@ def save_figure(
     return filepath
 
 
+def plot_shared_histograms(
+    ax,
+    data: Dict[str, np.ndarray],
+    bins: int = 50,
+    density: bool = False,
+    alpha: float = 0.5
+) -> np.ndarray:
+    """
+    Overlay histograms of several datasets on common bin edges.
+    
+    The edges are computed once from all finite values, so the bars of
+    every dataset line up; each dataset is then binned with np.histogram
+    and drawn with ax.stairs.
+    
+    Args:
+        ax: Matplotlib axis.
+        data: Mapping of legend label to values.
+        bins: Number of histogram bins.
+        density: Whether to normalise each histogram to unit area.
+        alpha: Fill transparency.
+    
+    Returns:
+        Bin edges used (empty if there were no finite values).
+    """
+    finite = {
+        label: values[np.isfinite(values)]
+        for label, values in data.items()
+    }
+    non_empty = [values for values in finite.values() if values.size]
+    
+    if not non_empty:
+        return np.array([])
+    
+    edges = np.histogram_bin_edges(np.concatenate(non_empty), bins=bins)
+    
+    for label, values in finite.items():
+        if not values.size:
+            continue
+        counts, _ = np.histogram(values, bins=edges, density=density)
+        ax.stairs(counts, edges, fill=True, alpha=alpha, label=label)
+    
+    return edges
+
+
 def close_figure(fig):
     """Close figure to free memory."""
     plt.close(fig)
@@ -4,6 +4,7 @@ Scatter plot functions.
 Influent vs effluent concentration plots.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -11,6 +12,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 
+from ..utils.file_helpers import ensure_dir
 from .plots import setup_matplotlib, save_figure
 
 
@@ -20,7 +22,9 @@ def plot_influent_effluent(
     scenarios: List[str] = None,
     output_dir: Optional[Path] = None,
     save: bool = True,
-    show: bool = True
+    show: bool = True,
+    max_points: int = 5000,
+    _dir_ready: bool = False
 ) -> plt.Figure:
     """
     Plot influent vs effluent for a parameter (BOD or COD).
@@ -32,6 +36,11 @@ def plot_influent_effluent(
         output_dir: Directory to save plot.
         save: Whether to save the plot.
         show: Whether to display the plot.
+        max_points: Maximum points drawn per scenario. Larger scenarios
+                    are thinned with a regular stride over the sorted data;
+                    0 or less draws every point.
+        _dir_ready: Skip creating output_dir; set by plot_all_scatter,
+                    which creates it once.
     
     Returns:
         Matplotlib figure.
@@ -46,7 +55,9 @@ def plot_influent_effluent(
     n_cols = min(4, n_scenarios)
     n_rows = (n_scenarios + n_cols - 1) // n_cols
     
-    fig, axs = plt.subplots(n_rows, n_cols, figsize=(5*n_cols, 5*n_rows))
+    fig, axs = setup_matplotlib(
+        (5*n_cols, 5*n_rows), nrows=n_rows, ncols=n_cols, show=show
+    )
     fig.suptitle(f'{param} Influent vs Effluent')
     
     if n_scenarios == 1:
@@ -59,13 +70,19 @@ def plot_influent_effluent(
         if df.empty or influent_col not in df.columns:
             continue
         
-        # Sort data
-        influent_sorted = np.sort(df[influent_col])
-        effluent_sorted = np.array(df[effluent_col])[
-            np.argsort(df[influent_col])
-        ]
+        # Sort data by influent with a single argsort
+        influent = df[influent_col].to_numpy()
+        order = np.argsort(influent, kind="stable")
         
-        axs[idx].scatter(influent_sorted, effluent_sorted, alpha=0.5, s=10)
+        # Thin overplotted scenarios; the stride keeps the influent coverage
+        if max_points > 0:
+            order = order[::max(1, -(-len(order) // max_points))]
+        influent_sorted = influent[order]
+        effluent_sorted = df[effluent_col].to_numpy()[order]
+        
+        axs[idx].scatter(
+            influent_sorted, effluent_sorted, alpha=0.5, s=10, rasterized=True
+        )
         axs[idx].set_xlabel('Influent')
         axs[idx].set_ylabel('Effluent')
         axs[idx].set_title(f'{param} ({scenario})')
@@ -75,10 +92,10 @@ def plot_influent_effluent(
     for idx in range(n_scenarios, len(axs)):
         axs[idx].set_visible(False)
     
-    plt.tight_layout()
-    
     if save and output_dir:
-        save_figure(fig, f"{param.lower()}_scatter.png", output_dir)
+        save_figure(
+            fig, f"{param.lower()}_scatter.png", output_dir, _dir_ready=_dir_ready
+        )
     
     if not show:
         plt.close(fig)
@@ -89,7 +106,9 @@ def plot_influent_effluent(
 def plot_all_scatter(
     results: Dict[str, pd.DataFrame],
     output_dir: Optional[Path] = None,
-    save: bool = True
+    save: bool = True,
+    show: bool = True,
+    max_workers: Optional[int] = None
 ) -> Dict[str, plt.Figure]:
     """
     Plot all BOD and COD scatter plots.
@@ -98,19 +117,51 @@ def plot_all_scatter(
         results: Dictionary of scenario DataFrames.
         output_dir: Directory to save plots.
         save: Whether to save plots.
+        show: Whether to keep the figures open for display.
+        max_workers: Number of worker processes used to render the
+                     figures when show is False. None or 1 renders them
+                     sequentially.
     
     Returns:
         Dictionary of figures.
     """
-    figures = {}
-    
-    for param in ['BOD', 'COD']:
-        fig = plot_influent_effluent(
-            results, 
-            param, 
-            output_dir=output_dir, 
-            save=save
-        )
-        figures[param] = fig
+    params = ['BOD', 'COD']
     
-    return figures
+    # Create the output directory once for both figures
+    if save and output_dir:
+        ensure_dir(output_dir)
+    
+    # Figures rendered in other processes cannot be shown here
+    if show or max_workers is None or max_workers <= 1:
+        return {
+            param: plot_influent_effluent(
+                results, 
+                param, 
+                output_dir=output_dir, 
+                save=save,
+                show=show,
+                _dir_ready=True
+            )
+            for param in params
+        }
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        
+        for param in params:
+            # Send each worker only the influent/effluent columns it plots
+            columns = [f"{param.lower()}1", f"{param.lower()}31"]
+            futures[param] = executor.submit(
+                plot_influent_effluent,
+                {
+                    name: df[columns] if columns[0] in df.columns else df
+                    for name, df in results.items()
+                },
+                param,
+                output_dir=output_dir,
+                save=save,
+                show=False,
+                _dir_ready=True
+            )
+        
+        return {param: future.result() for param, future in futures.items()}
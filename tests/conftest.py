@@ -29,9 +29,9 @@ def sample_data():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def compliance_limits():
-    """Create default compliance limits."""
+    """Create default compliance limits, shared as they are immutable."""
     return ComplianceLimits()
 
 
@@ -0,0 +1,29 @@
+"""
+Tests for category counting helpers.
+"""
+
+import pandas as pd
+
+from nonlinearity.config import FAIL_TYPES, FAIL_SOURCES
+from nonlinearity.data.categories import count_categories
+
+
+class TestCountCategories:
+    """Tests for category counting."""
+    
+    def test_categorical(self):
+        """Test counting from categorical codes."""
+        series = pd.Series(pd.Categorical(
+            ["Compliant", "LUT exceedance", "Compliant", None],
+            categories=FAIL_TYPES
+        ))
+        counts = count_categories(series, FAIL_TYPES)
+        
+        assert counts == {"Compliant": 2, "LUT exceedance": 1, "Max Limit Failure": 0}
+    
+    def test_strings(self):
+        """Test counting plain string values."""
+        series = pd.Series(["BOD", "COD", "BOD"])
+        counts = count_categories(series, FAIL_SOURCES)
+        
+        assert counts == {"None": 0, "BOD": 2, "COD": 1}
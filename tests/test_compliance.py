@@ -4,6 +4,7 @@ Tests for core compliance calculations.
 
 import pytest
 import pandas as pd
+import numpy as np
 
 from nonlinearity.core.compliance import (
     calculate_bod_limits,
@@ -11,6 +12,7 @@ from nonlinearity.core.compliance import (
     calculate_all_limits,
     calculate_flag_conditions,
     calculate_failure_conditions,
+    failure_masks,
 )
 
 
@@ -26,6 +28,16 @@ class TestCalculateBODLimits:
         assert len(result) == len(sample_data)
 
 
+    def test_bod_limits_copy(self, sample_data, compliance_limits):
+        """Test the input is left untouched unless copy=False."""
+        calculate_bod_limits(sample_data, compliance_limits)
+        assert 'BODut' not in sample_data.columns
+        
+        result = calculate_bod_limits(sample_data, compliance_limits, copy=False)
+        assert result is sample_data
+        assert 'BODut' in sample_data.columns
+
+
 class TestCalculateCODLimits:
     """Tests for COD limit calculations."""
     
@@ -62,3 +74,38 @@ class TestFlagConditions:
         assert 'flag_BODut' in result.columns
         assert 'flag_CODlt' in result.columns
         assert 'flag_CODut' in result.columns
+
+
+class TestFailureConditions:
+    """Tests for failure condition calculations."""
+    
+    def test_failure_conditions(self, processed_data):
+        """Test failure conditions match the stored flags."""
+        result = calculate_failure_conditions(processed_data)
+        
+        for name in ('bod_lut_exc', 'bod_max_lim', 'cod_lut_exc', 'cod_max_lim'):
+            assert result[name].dtype == bool
+            assert result[name].equals(processed_data[name].rename(name))
+        
+        # LUT and max-limit failures are exclusive for each parameter
+        assert not (result['bod_lut_exc'] & result['bod_max_lim']).any()
+        assert not (result['cod_lut_exc'] & result['cod_max_lim']).any()
+    
+    def test_failure_masks(self, processed_data):
+        """Test masks are numpy arrays matching the Series conditions."""
+        masks = failure_masks(processed_data)
+        conditions = calculate_failure_conditions(processed_data)
+        
+        for name, mask in masks.items():
+            assert isinstance(mask, np.ndarray)
+            assert (mask == conditions[name].to_numpy()).all()
+    
+    def test_failure_masks_object_flags(self, processed_data):
+        """Test object-dtype flags give the same masks as bool flags."""
+        flag_cols = [col for col in processed_data.columns if col.startswith('flag_')]
+        legacy = processed_data.astype({col: object for col in flag_cols})
+        
+        expected = failure_masks(processed_data)
+        for name, mask in failure_masks(legacy).items():
+            assert mask.dtype == bool
+            assert (mask == expected[name]).all()
@@ -15,9 +15,9 @@ from nonlinearity.config import (
 class TestComplianceLimits:
     """Tests for ComplianceLimits dataclass."""
     
-    def test_default_values(self):
+    def test_default_values(self, compliance_limits):
         """Test default compliance limits."""
-        limits = ComplianceLimits()
+        limits = compliance_limits
         
         assert limits.bod_upper == 50
         assert limits.bod_lower == 25
@@ -26,31 +26,40 @@ class TestComplianceLimits:
         assert limits.bod_pc == 0.7
         assert limits.cod_pc == 0.75
     
-    def test_to_dict(self):
+    def test_to_dict(self, compliance_limits):
         """Test conversion to dictionary."""
-        limits = ComplianceLimits()
-        d = limits.to_dict()
+        d = compliance_limits.to_dict()
         
         assert isinstance(d, dict)
         assert d["bod_upper"] == 50
         assert d["cod_pc"] == 0.75
+    
+    def test_hashable(self):
+        """Test limits are slotted and usable as cache keys."""
+        limits = ComplianceLimits()
+        
+        assert not hasattr(limits, "__dict__")
+        assert hash(limits) == hash(ComplianceLimits())
+        assert {limits: 1}[ComplianceLimits()] == 1
 
 
 class TestProjectPaths:
     """Tests for ProjectPaths dataclass."""
     
-    def test_paths(self, tmp_path):
+    @pytest.fixture
+    def paths(self, tmp_path):
+        """Create project paths rooted at a temporary directory."""
+        return ProjectPaths(root=tmp_path)
+    
+    def test_paths(self, paths, tmp_path):
         """Test path properties."""
-        paths = ProjectPaths(root=tmp_path)
-        
         assert paths.data == tmp_path / "data"
         assert paths.output == tmp_path / "output"
         assert paths.csv_output == tmp_path / "output" / "csv"
         assert paths.plots_output == tmp_path / "output" / "plots"
     
-    def test_ensure_output_dirs(self, tmp_path):
+    def test_ensure_output_dirs(self, paths):
         """Test output directory creation."""
-        paths = ProjectPaths(root=tmp_path)
         paths.ensure_output_dirs()
         
         assert paths.csv_output.exists()
@@ -83,3 +92,8 @@ class TestGetConfig:
         
         assert isinstance(limits, ComplianceLimits)
         assert isinstance(paths, ProjectPaths)
+    
+    def test_get_config_cached(self, tmp_path):
+        """Test config is memoised per root path."""
+        assert get_config(tmp_path) is get_config(tmp_path)
+        assert get_config(tmp_path)[1].root == tmp_path
@@ -0,0 +1,97 @@
+"""
+Tests for data loading functions.
+"""
+
+import numpy as np
+import pandas as pd
+
+from nonlinearity.data.loaders import convert_pickle_folder, process_folder
+
+
+class TestProcessFolder:
+    """Tests for combining a folder of pickles."""
+    
+    def test_files_with_different_columns(self, tmp_path, compliance_limits):
+        """Test columns missing from some files are padded like pd.concat."""
+        frames = {
+            "profile_run_1.pkl": pd.DataFrame({
+                "bod1": [100.0, 150.0],
+                "time": pd.date_range("2020-01-01", periods=2),
+                "label": ["a", "b"],
+            }),
+            "profile_run_2.pkl": pd.DataFrame({
+                "bod1": [200.0, 250.0, 300.0],
+                "cod1": [400.0, 500.0, 600.0],
+            }),
+        }
+        for name, frame in frames.items():
+            frame.to_pickle(tmp_path / name)
+        
+        result = process_folder(tmp_path, compliance_limits)
+        
+        assert len(result) == 5
+        assert result["bod1"].dtype == np.float32
+        assert result["time"].dtype.kind == "M"
+        assert result["time"].isna().sum() == 3
+        assert result["label"].isna().sum() == 3
+        assert result["cod1"].isna().sum() == 2
+        assert sorted(result["bod1"].tolist()) == [100, 150, 200, 250, 300]
+    
+    def test_extension_dtypes(self, tmp_path, compliance_limits):
+        """Test extension-dtype columns keep their dtype, with or without gaps."""
+        pd.DataFrame({
+            "bod1": [100.0, 150.0],
+            "time": pd.date_range("2020-01-01", periods=2, tz="UTC"),
+            "count": pd.array([1, None], dtype="Int64"),
+            "source": pd.Categorical(["BOD", "COD"]),
+        }).to_pickle(tmp_path / "profile_run_1.pkl")
+        pd.DataFrame({
+            "bod1": [200.0],
+            "time": pd.date_range("2020-02-01", periods=1, tz="UTC"),
+        }).to_pickle(tmp_path / "profile_run_2.pkl")
+        
+        result = process_folder(tmp_path, compliance_limits)
+        
+        assert str(result["time"].dtype.tz) == "UTC"
+        assert result["count"].dtype == "Int64"
+        assert isinstance(result["source"].dtype, pd.CategoricalDtype)
+        assert result["count"].isna().sum() == 2
+        assert result["source"].isna().sum() == 1
+    
+    def test_missing_folder(self, tmp_path, compliance_limits):
+        """Test a missing folder gives an empty DataFrame."""
+        assert process_folder(tmp_path / "missing", compliance_limits).empty
+
+
+class TestConvertPickleFolder:
+    """Tests for the one-off numeric pickle conversion."""
+    
+    def test_round_trip(self, tmp_path, sample_data):
+        """Test converted copies load back with equal numeric values."""
+        source = tmp_path / "source"
+        target = tmp_path / "target"
+        source.mkdir()
+        sample_data.astype(object).to_pickle(source / "profile_run_1.pkl")
+        sample_data.to_pickle(source / "profile_run_2.pkl")
+        
+        assert convert_pickle_folder(source, target) == 1
+        
+        # Sources are left untouched
+        assert (pd.read_pickle(source / "profile_run_1.pkl").dtypes == object).all()
+        assert sorted(p.name for p in target.iterdir()) == [
+            "profile_run_1.pkl", "profile_run_2.pkl"
+        ]
+        for path in target.iterdir():
+            converted = pd.read_pickle(path)
+            assert not (converted.dtypes == object).any()
+            pd.testing.assert_frame_equal(converted, sample_data)
+    
+    def test_in_place(self, tmp_path, sample_data):
+        """Test in-place conversion replaces the file and leaves no temporaries."""
+        sample_data.astype(object).to_pickle(tmp_path / "profile_run_1.pkl")
+        
+        assert convert_pickle_folder(tmp_path) == 1
+        assert [p.name for p in tmp_path.iterdir()] == ["profile_run_1.pkl"]
+        pd.testing.assert_frame_equal(
+            pd.read_pickle(tmp_path / "profile_run_1.pkl"), sample_data
+        )
@@ -0,0 +1,23 @@
+"""
+Tests for core metric calculations.
+"""
+
+import pandas as pd
+
+from nonlinearity.config import FAIL_TYPES, FAIL_SOURCES
+
+
+class TestFailureColumns:
+    """Tests for the fail_type and fail_source columns."""
+    
+    def test_categorical_dtype(self, processed_data):
+        """Test failure columns are int8-coded categoricals."""
+        for col, categories in (("fail_type", FAIL_TYPES), ("fail_source", FAIL_SOURCES)):
+            assert isinstance(processed_data[col].dtype, pd.CategoricalDtype)
+            assert tuple(processed_data[col].cat.categories) == categories
+            assert processed_data[col].cat.codes.dtype == "int8"
+    
+    def test_compliant_rows_have_no_source(self, processed_data):
+        """Test compliant rows are attributed to no source."""
+        compliant = processed_data["fail_type"] == "Compliant"
+        assert (processed_data.loc[compliant, "fail_source"] == "None").all()
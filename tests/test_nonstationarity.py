@@ -0,0 +1,85 @@
+"""
+Tests for non-stationarity analysis.
+"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from nonlinearity.analysis.nonstationarity import (
+    non_stationarity_score,
+    compute_nonstationarity_table,
+)
+
+
+def _reference_score(series: pd.Series, window: int) -> float:
+    """Pandas rolling-variance score used before vectorisation."""
+    clean = series.dropna()
+    rolling_var = clean.rolling(window=window).var()
+    overall_var = clean.var()
+    return float((rolling_var - overall_var).abs().mean() / overall_var)
+
+
+class TestNonStationarityScore:
+    """Tests for non_stationarity_score."""
+    
+    @pytest.mark.parametrize("window", [2, 5, 30])
+    def test_matches_pandas_rolling(self, window):
+        """Test score matches the pandas rolling implementation."""
+        rng = np.random.default_rng(0)
+        series = pd.Series(rng.lognormal(size=500) + np.linspace(0, 3, 500))
+        
+        assert non_stationarity_score(series, window) == pytest.approx(
+            _reference_score(series, window)
+        )
+    
+    def test_ignores_nan(self):
+        """Test NaN values are dropped before scoring."""
+        series = pd.Series(np.arange(100, dtype=float) ** 1.5)
+        with_nan = series.copy()
+        with_nan[[3, 50]] = np.nan
+        
+        assert non_stationarity_score(with_nan, 10) == pytest.approx(
+            _reference_score(with_nan, 10)
+        )
+    
+    def test_short_series(self):
+        """Test series shorter than the window returns NaN."""
+        assert np.isnan(non_stationarity_score(pd.Series([1.0, 2.0]), 30))
+    
+    def test_window_one(self):
+        """Test a window of one returns NaN without a RuntimeWarning."""
+        series = pd.Series(np.arange(20, dtype=float) ** 2)
+        
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert np.isnan(non_stationarity_score(series, 1))
+    
+    def test_constant_series(self):
+        """Test constant series scores zero."""
+        assert non_stationarity_score(pd.Series([5.0] * 50), 10) == 0.0
+
+
+class TestNonStationarityTable:
+    """Tests for compute_nonstationarity_table."""
+    
+    def test_matches_per_column_scores(self):
+        """Test table scores equal scoring each column on its own."""
+        rng = np.random.default_rng(1)
+        df = pd.DataFrame(rng.normal(size=(200, 2)), columns=["a", "b"])
+        df["c"] = 1.0
+        with_nan = df.copy()
+        with_nan.loc[7, "a"] = np.nan
+        
+        table = compute_nonstationarity_table(
+            {"clean": df, "nan": with_nan}, columns=["a", "b", "c", "missing"]
+        )
+        
+        assert list(table.columns) == ["Dataset", "a", "b", "c"]
+        for row, frame in zip(table.itertuples(), [df, with_nan]):
+            for col in ["a", "b", "c"]:
+                assert getattr(row, col) == pytest.approx(
+                    non_stationarity_score(frame[col])
+                )
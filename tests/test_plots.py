@@ -0,0 +1,37 @@
+"""
+Tests for plotting functions.
+"""
+
+import matplotlib
+matplotlib.use("Agg")
+
+from nonlinearity.visualisation.histograms import plot_all_concentration_histograms
+from nonlinearity.visualisation.scatter import plot_all_scatter, plot_influent_effluent
+
+
+class TestPlotAllDrivers:
+    """Tests for the plot_all_* drivers."""
+    
+    def test_output_dir_created(self, tmp_path, sample_data):
+        """Test the drivers create a missing output directory before saving."""
+        results = {"baseline": sample_data}
+        
+        histogram_dir = tmp_path / "histograms" / "plots"
+        plot_all_concentration_histograms(results, output_dir=histogram_dir, show=False)
+        assert len(list(histogram_dir.glob("histogram_*.png"))) == 4
+        
+        scatter_dir = tmp_path / "scatter" / "plots"
+        plot_all_scatter(results, output_dir=scatter_dir, show=False)
+        assert len(list(scatter_dir.glob("*_scatter.png"))) == 2
+
+
+class TestInfluentEffluent:
+    """Tests for the influent vs effluent scatter plot."""
+    
+    def test_no_thinning(self, sample_data):
+        """Test max_points of zero draws every point."""
+        fig = plot_influent_effluent(
+            {"baseline": sample_data}, "BOD", save=False, show=False, max_points=0
+        )
+        
+        assert len(fig.axes[0].collections[0].get_offsets()) == len(sample_data)
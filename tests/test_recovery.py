@@ -0,0 +1,65 @@
+"""
+Tests for recovery time analysis.
+"""
+
+import pandas as pd
+import pytest
+
+from nonlinearity.analysis.recovery import compute_recovery_time
+
+
+class TestComputeRecoveryTime:
+    """Tests for compute_recovery_time."""
+    
+    def test_runs(self):
+        """Test each non-compliance run yields one recovery time."""
+        series = pd.Series([
+            "Compliant", "LUT exceedance", "LUT exceedance", "Compliant",
+            "Max Limit Failure", "Compliant", "Compliant",
+        ])
+        
+        assert compute_recovery_time(series, time_step=0.5) == [1.0, 0.5]
+    
+    def test_mixed_failure_types_form_one_run(self):
+        """Test adjacent failures of different types are a single run."""
+        series = pd.Series(["LUT exceedance", "Max Limit Failure", "Compliant"])
+        
+        assert compute_recovery_time(series, time_step=1.0) == [2.0]
+    
+    def test_ongoing_at_end(self):
+        """Test a run still open at the end of the series is counted."""
+        series = pd.Series(["Compliant", "Max Limit Failure", "Max Limit Failure"])
+        
+        assert compute_recovery_time(series, time_step=0.08) == [0.16]
+    
+    def test_categorical(self):
+        """Test categorical series give the same result as strings."""
+        series = pd.Series([
+            "Compliant", "LUT exceedance", "Compliant", "Max Limit Failure",
+        ])
+        
+        assert compute_recovery_time(series.astype("category"), 1.0) == (
+            compute_recovery_time(series, 1.0)
+        )
+    
+    def test_categorical_missing_failure_type(self):
+        """Test failure types absent from the categories are ignored."""
+        series = pd.Series(["Compliant", "LUT exceedance"], dtype="category")
+        
+        assert compute_recovery_time(series, 1.0) == [1.0]
+    
+    def test_boolean_mask(self):
+        """Test a boolean failure mask is used directly."""
+        mask = pd.Series([False, True, True, False, True])
+        
+        assert compute_recovery_time(mask, time_step=1.0) == [2.0, 1.0]
+    
+    def test_all_compliant(self):
+        """Test a fully compliant series has no recovery times."""
+        series = pd.Series(["Compliant"] * 5)
+        
+        assert compute_recovery_time(series) == []
+    
+    def test_empty(self):
+        """Test an empty series has no recovery times."""
+        assert compute_recovery_time(pd.Series([], dtype=object)) == []
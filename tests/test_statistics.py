@@ -0,0 +1,30 @@
+"""
+Tests for statistical analysis functions.
+"""
+
+import pandas as pd
+
+from nonlinearity.analysis.statistics import get_compliance_summary
+
+
+class TestComplianceSummary:
+    """Tests for the compliance summary table."""
+    
+    def test_processed_data(self, processed_data):
+        """Test counts from the precomputed boolean columns."""
+        summary = get_compliance_summary({"baseline": processed_data})
+        row = summary.iloc[0]
+        
+        assert row["Compliant"] + row["LUT Exceedance"] + row["Max Limit Failure"] == len(processed_data)
+    
+    def test_partial_flag_columns(self):
+        """Test a frame with only some boolean columns falls back to fail_type."""
+        df = pd.DataFrame({
+            "fail_type": ["Compliant", "LUT exceedance", "Compliant"],
+            "is_failure": [False, True, False],
+        })
+        row = get_compliance_summary({"baseline": df}).iloc[0]
+        
+        assert row["Compliant"] == 2
+        assert row["LUT Exceedance"] == 1
+        assert row["Max Limit Failure"] == 0
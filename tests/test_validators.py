@@ -0,0 +1,90 @@
+"""
+Tests for data validation functions.
+"""
+
+import pytest
+import pandas as pd
+
+from nonlinearity.data.validators import (
+    DataValidationError,
+    check_required_columns,
+    has_required_columns,
+    validate_dataframe,
+    validate_numeric_columns,
+    get_data_quality_report,
+)
+
+
+class TestCheckRequiredColumns:
+    """Tests for required column checks."""
+    
+    def test_all_present(self, sample_data):
+        """Test no columns are reported when all are present."""
+        assert check_required_columns(sample_data) == []
+    
+    def test_missing_in_required_order(self, sample_data):
+        """Test missing columns are reported in required order."""
+        df = sample_data.drop(columns=['cod31', 'bod1'])
+        
+        assert check_required_columns(df) == ['bod1', 'cod31']
+    
+    def test_raise_error(self, sample_data):
+        """Test raising on missing columns."""
+        with pytest.raises(DataValidationError):
+            check_required_columns(sample_data, ['missing'], raise_error=True)
+
+
+class TestHasRequiredColumns:
+    """Tests for the boolean required column check."""
+    
+    def test_has_required_columns(self, sample_data):
+        """Test presence and absence of required columns."""
+        assert has_required_columns(sample_data)
+        assert not has_required_columns(sample_data.drop(columns=['bod1']))
+
+
+class TestValidateDataFrame:
+    """Tests for DataFrame validation."""
+    
+    def test_valid(self, sample_data):
+        """Test a complete DataFrame validates."""
+        assert validate_dataframe(sample_data)
+    
+    def test_empty(self):
+        """Test empty DataFrames are rejected unless allowed."""
+        with pytest.raises(DataValidationError):
+            validate_dataframe(pd.DataFrame())
+
+
+class TestValidateNumericColumns:
+    """Tests for numeric column validation."""
+    
+    def test_numeric_columns(self, sample_data):
+        """Test non-numeric and NA columns are reported."""
+        df = sample_data.astype(float)
+        df['label'] = 'x'
+        df.loc[0, 'bod1'] = float('nan')
+        
+        assert validate_numeric_columns(df, ['bod1', 'cod1', 'label']) == ['bod1', 'label']
+        assert validate_numeric_columns(df, ['bod1', 'label'], allow_na=True) == ['label']
+
+
+class TestDataQualityReport:
+    """Tests for the data quality report."""
+    
+    def test_report(self, sample_data):
+        """Test report contents."""
+        report = get_data_quality_report(sample_data)
+        
+        assert report["total_rows"] == len(sample_data)
+        assert report["missing_columns"] == []
+        assert report["has_expected_columns"]
+    
+    def test_null_counts(self, sample_data):
+        """Test null counts per column."""
+        df = sample_data.astype(float)
+        df.loc[[0, 2], 'bod1'] = float('nan')
+        report = get_data_quality_report(df)
+        
+        assert report["null_counts"]['bod1'] == 2
+        assert report["null_counts"]['cod1'] == 0